@@ -2,6 +2,7 @@
 Cooper Video Analysis Library.
 """
 
+import importlib
 import os
 from dotenv import load_dotenv
 
@@ -11,10 +12,26 @@ load_dotenv()
 # Set VERSION
 __version__ = "0.1.0"
 
-# Export all modules
-from src.scraper import Scraper, VideoData
-from src.video_finder import VideoFinder
-from src.text_emotion_analyzer import TextEmotionAnalyzer
-from src.audio_emotion_analyzer import AudioEmotionAnalyzer
-from src.correlator import Correlator
-from src.insight_generator import InsightGenerator
+# Export all modules. They are imported on first attribute access, so importing
+# one submodule (e.g. src.video_finder) does not load openai, pinecone or the
+# embedder along with every other component.
+_EXPORTS = {
+    "Scraper": "src.scraper",
+    "VideoData": "src.scraper",
+    "VideoFinder": "src.video_finder",
+    "TextEmotionAnalyzer": "src.text_emotion_analyzer",
+    "AudioEmotionAnalyzer": "src.audio_emotion_analyzer",
+    "Correlator": "src.correlator",
+    "InsightGenerator": "src.insight_generator",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
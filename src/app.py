@@ -1,8 +1,11 @@
-from typing import List, Dict, Optional
-from fastapi import FastAPI, Query, HTTPException
+from typing import Any, AsyncIterator, Callable, List, Dict, Mapping, Optional, Sequence, Tuple
+import asyncio
+import json
+from fastapi import Body, FastAPI, Header, Query, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from src.video_finder import VideoFinder
-from src.scraper import Scraper, ScrapeConfig, VideoData
+from src.scraper import WEBHOOK_SECRET_HEADER, Scraper, ScrapeConfig, VideoData, metadata_matrix
 from src.text_emotion_analyzer import TextEmotionAnalyzer
 from src.audio_emotion_analyzer import AudioEmotionAnalyzer
 from src.correlator import Correlator
@@ -17,37 +20,49 @@ class ChatResponse(BaseModel):
     insights: List[str]
     pr_hooks: List[str]
 
-@app.get("/chat", response_model=ChatResponse)
-def chat_endpoint(
-    query: str = Query(..., description="Topic to analyze"),
-    limit: int = Query(10, ge=1, le=20),
-    url: Optional[str] = Query(None, description="Direct TikTok URL to analyze"),
-) -> ChatResponse:
-    """
-    Orchestrates the full Cooper pipeline:
-    VideoFinder → Scraper → EmotionAnalyzers → Correlator → InsightGenerator
 
-    Supports either topic-based search or direct TikTok URL analysis.
-    """
-    # Step 1: Find videos based on query or direct URL
-    video_finder = VideoFinder()
+# --- Shared components ---
+
+# Pipeline components hold no per-request state, so each is built once per process
+# (on first use, since constructors read credentials from the environment)
+_components: Dict[Callable[[], Any], Any] = {}
+
+
+def _shared(factory: Callable[[], Any]) -> Any:
+    """Return the process-wide instance built by factory, creating it on first use."""
+    instance = _components.get(factory)
+    if instance is None:
+        instance = _components[factory] = factory()
+    return instance
+
+
+# --- Pipeline stages ---
+
+def _find_videos(query: str, limit: int, url: Optional[str]) -> Sequence[str]:
+    """Step 1: Find videos based on query or direct URL."""
+    video_finder = _shared(VideoFinder)
     video_urls = video_finder.get_videos(query, direct_url=url)[:limit]
 
     if not video_urls:
         raise HTTPException(status_code=404, detail="No videos found for query or invalid TikTok URL")
 
-    # Step 2: Scrape video data
+    return video_urls
+
+
+async def _scrape_videos(video_urls: Sequence[str]) -> List[VideoData]:
+    """Step 2: Scrape video data."""
     try:
-        scraper = Scraper()
+        # The scraper is async and keeps its HTTP client open, so one instance
+        # polls every in-flight job on the event loop
+        scraper = _shared(Scraper)
         config = ScrapeConfig(
             commentsPerPost=10,
             excludePinnedPosts=True,
             maxRepliesPerComment=5,
             resultsPerPage=20,
-            postURLs=video_urls
+            postURLs=list(video_urls)
         )
-        scraper.start_scrape(config)
-        video_data_list = scraper.get_result()
+        video_data_list = await scraper.scrape(config)
     except TimeoutError:
         raise HTTPException(status_code=504, detail="Scraping operation timed out")
     except Exception as e:
@@ -56,41 +71,184 @@ def chat_endpoint(
     if not video_data_list:
         raise HTTPException(status_code=404, detail="Failed to scrape any video data")
 
-    # Step 3: Analyze emotions in text and audio
-    try:
-        text_analyzer = TextEmotionAnalyzer()
-        audio_analyzer = AudioEmotionAnalyzer()
+    return video_data_list
 
-        text_emotions = text_analyzer.analyze(video_data_list)
-        audio_emotions = audio_analyzer.analyze(video_data_list)
 
-        emotions = {
-            "text": text_emotions,
-            "audio": audio_emotions
-        }
+async def _analyze_emotions(
+    video_data_list: List[VideoData]
+) -> Tuple[Mapping[str, float], Dict[str, float]]:
+    """Step 3: Analyze emotions in text and audio."""
+    try:
+        text_analyzer = _shared(TextEmotionAnalyzer)
+        audio_analyzer = _shared(AudioEmotionAnalyzer)
+
+        # The two analyzers are independent, so overlap their round-trips
+        text_task = asyncio.create_task(text_analyzer.analyze(video_data_list))
+        audio_task = asyncio.create_task(audio_analyzer.analyze(video_data_list))
+        text_emotions, audio_emotions = await asyncio.gather(text_task, audio_task)
     except Exception as e:
         raise HTTPException(status_code=502, detail=f"Error during emotion analysis: {str(e)}")
 
-    # Step 4: Compute correlations
+    return text_emotions, audio_emotions
+
+
+async def _compute_correlations(
+    video_data_list: List[VideoData],
+    text_emotions: Mapping[str, float],
+    audio_emotions: Dict[str, float]
+) -> Dict[str, float]:
+    """Step 4: Compute correlations."""
     try:
-        correlator = Correlator()
-        correlations = correlator.compute(video_data_list, text_emotions, audio_emotions)
+        correlator = _shared(Correlator)
+        # Hand the correlator the metadata as one array so it reduces over it directly
+        matrix = metadata_matrix(video_data_list)
+        return await asyncio.to_thread(
+            correlator.compute, video_data_list, text_emotions, audio_emotions, metadata_matrix=matrix
+        )
     except Exception as e:
         raise HTTPException(status_code=502, detail=f"Error during correlation analysis: {str(e)}")
 
-    # Step 5: Generate insights and PR hooks
+
+async def _generate_insights(
+    insight_generator: InsightGenerator,
+    correlations: Dict[str, float]
+) -> List[str]:
+    """Step 5a: Generate insights."""
+    try:
+        return await insight_generator.generate(correlations)
+    except Exception as e:
+        raise HTTPException(status_code=502, detail=f"Error during insight generation: {str(e)}")
+
+
+async def _generate_insights_and_hooks(
+    insight_generator: InsightGenerator,
+    correlations: Dict[str, float]
+) -> Tuple[List[str], List[str]]:
+    """Step 5: Generate insights and PR hooks, overlapping the tone-guideline lookup."""
+    try:
+        return await insight_generator.generate_with_hooks(correlations)
+    except Exception as e:
+        raise HTTPException(status_code=502, detail=f"Error during insight generation: {str(e)}")
+
+
+async def _suggest_pr_hooks(insight_generator: InsightGenerator, insights: List[str]) -> List[str]:
+    """Step 5b: Suggest PR hooks for the generated insights."""
+    try:
+        return await insight_generator.suggest_pr_hooks(insights)
+    except Exception as e:
+        raise HTTPException(status_code=502, detail=f"Error during insight generation: {str(e)}")
+
+
+# --- Endpoints ---
+
+@app.get("/chat", response_model=ChatResponse)
+async def chat_endpoint(
+    query: str = Query(..., description="Topic to analyze"),
+    limit: int = Query(10, ge=1, le=20),
+    url: Optional[str] = Query(None, description="Direct TikTok URL to analyze"),
+) -> ChatResponse:
+    """
+    Orchestrates the full Cooper pipeline:
+    VideoFinder → Scraper → EmotionAnalyzers → Correlator → InsightGenerator
+
+    Supports either topic-based search or direct TikTok URL analysis.
+    Video lookup is an in-memory call. Scraping, emotion analysis and insight
+    generation are awaited natively on the event loop, with the text and audio
+    analyzers running concurrently; only the CPU-bound correlator runs in a
+    worker thread.
+    """
+    video_urls = _find_videos(query, limit, url)
+    video_data_list = await _scrape_videos(video_urls)
+    text_emotions, audio_emotions = await _analyze_emotions(video_data_list)
+    correlations = await _compute_correlations(video_data_list, text_emotions, audio_emotions)
+
     try:
-        insight_generator = InsightGenerator()
-        insights = insight_generator.generate(video_data_list, text_emotions, audio_emotions, correlations)
-        pr_hooks = insight_generator.suggest_pr_hooks(insights)
+        insight_generator = _shared(InsightGenerator)
     except Exception as e:
         raise HTTPException(status_code=502, detail=f"Error during insight generation: {str(e)}")
+    insights, pr_hooks = await _generate_insights_and_hooks(insight_generator, correlations)
 
     # Construct response
     return ChatResponse(
         videos=video_urls,
-        emotions=emotions,
+        emotions={
+            "text": text_emotions,
+            "audio": audio_emotions
+        },
         correlations=correlations,
         insights=insights,
         pr_hooks=pr_hooks
     )
+
+
+@app.post("/apify/callback")
+async def apify_callback_endpoint(
+    payload: Dict[str, Any] = Body(...),
+    webhook_secret: Optional[str] = Header(None, alias=WEBHOOK_SECRET_HEADER),
+) -> Dict[str, str]:
+    """
+    Receive Apify's run-finished webhook and wake the request waiting on that run.
+
+    Set APIFY_CALLBACK_URL to this URL and APIFY_WEBHOOK_SECRET to a shared secret
+    so get_result does not poll. Requests without that secret are rejected, and
+    callbacks for runs no request is waiting on are ignored.
+    """
+    try:
+        scraper = _shared(Scraper)
+    except ValueError as e:
+        raise HTTPException(status_code=503, detail=f"Scraper is not configured: {str(e)}")
+    if not scraper.verify_callback(webhook_secret):
+        raise HTTPException(status_code=401, detail="Invalid webhook secret")
+
+    run_id = payload.get("eventData", {}).get("actorRunId") or payload.get("resource", {}).get("id")
+    if not run_id:
+        raise HTTPException(status_code=400, detail="Webhook payload has no run id")
+
+    return {"status": "ok" if scraper.notify(run_id, payload) else "ignored"}
+
+
+def _stream_event(stage: str, data) -> str:
+    """Serialize one pipeline event as a JSON line; read-only mappings are written as objects."""
+    return json.dumps({"stage": stage, "data": data}, default=dict) + "\n"
+
+
+@app.get("/chat/stream")
+async def chat_stream_endpoint(
+    query: str = Query(..., description="Topic to analyze"),
+    limit: int = Query(10, ge=1, le=20),
+    url: Optional[str] = Query(None, description="Direct TikTok URL to analyze"),
+) -> StreamingResponse:
+    """
+    Same pipeline as /chat, streamed as newline-delimited JSON.
+
+    Emits one event per stage (videos → emotions → correlations → insights → pr_hooks)
+    as soon as it completes. Video lookup runs before the stream opens so an unknown
+    topic still returns a 404; later failures are reported as an "error" event.
+    """
+    video_urls = _find_videos(query, limit, url)
+
+    async def event_stream() -> AsyncIterator[str]:
+        yield _stream_event("videos", video_urls)
+
+        try:
+            video_data_list = await _scrape_videos(video_urls)
+
+            text_emotions, audio_emotions = await _analyze_emotions(video_data_list)
+            yield _stream_event("emotions", {"text": text_emotions, "audio": audio_emotions})
+
+            correlations = await _compute_correlations(video_data_list, text_emotions, audio_emotions)
+            yield _stream_event("correlations", correlations)
+
+            try:
+                insight_generator = _shared(InsightGenerator)
+            except Exception as e:
+                raise HTTPException(status_code=502, detail=f"Error during insight generation: {str(e)}")
+            insights = await _generate_insights(insight_generator, correlations)
+            yield _stream_event("insights", insights)
+
+            pr_hooks = await _suggest_pr_hooks(insight_generator, insights)
+            yield _stream_event("pr_hooks", pr_hooks)
+        except HTTPException as e:
+            yield json.dumps({"stage": "error", "status_code": e.status_code, "detail": e.detail}) + "\n"
+
+    return StreamingResponse(event_stream(), media_type="application/x-ndjson")
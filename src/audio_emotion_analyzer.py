@@ -1,32 +1,152 @@
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
+import asyncio
 import os
-import json
-import tempfile
-from pathlib import Path
-from openai import OpenAI
+import orjson
+from src.openai_client import get_async_client
+from src.cache import LRUCache, content_hash
+
+if TYPE_CHECKING:
+    from faster_whisper import WhisperModel
+
+# Scores returned in dummy mode
+_DUMMY_SCORES = {
+    "joy": 0.7,
+    "sadness": 0.1,
+    "anger": 0.1,
+    "fear": 0.05,
+    "surprise": 0.05,
+    "disgust": 0.0,
+    "neutral": 0.0
+}
+
+# Scores returned when there is nothing to analyze or the response can't be parsed
+_NEUTRAL_SCORES = {
+    "neutral": 1.0,
+    "joy": 0.0,
+    "sadness": 0.0,
+    "anger": 0.0,
+    "fear": 0.0,
+    "surprise": 0.0,
+    "disgust": 0.0
+}
+
+# System prompt for scoring a single transcript
+_TRANSCRIPT_SYSTEM_PROMPT = """
+You are an expert in emotion analysis. Analyze the following audio transcript and determine the emotional content.
+Return a JSON object with the following emotions and their corresponding confidence scores (0.0-1.0):
+- joy
+- sadness
+- anger
+- fear
+- surprise
+- disgust
+- neutral
+
+The scores should sum to 1.0.
+Only return the JSON object, nothing else.
+"""
+
+# System prompt for scoring several numbered transcripts in one request
+_BATCH_SYSTEM_PROMPT = """
+You are an expert in emotion analysis. Analyze each of the numbered audio transcripts below and determine its emotional content.
+Return a JSON object of the form {"results": [...]} containing exactly one object per transcript, in the same order.
+Each object must contain the following emotions and their corresponding confidence scores (0.0-1.0):
+- joy
+- sadness
+- anger
+- fear
+- surprise
+- disgust
+- neutral
+
+The scores in each object should sum to 1.0.
+Only return the JSON object, nothing else.
+"""
+
+# Upper bound on transcript characters sent in one batched chat request
+MAX_BATCH_CHARS = 12000
+
+def _load_whisper_model(model_name: str, num_workers: int) -> "WhisperModel":
+    """
+    Load a local int8 faster-whisper model.
+
+    faster-whisper is imported here, on first use, so only api_key="local" pays for it.
+
+    Args:
+        model_name: faster-whisper model size
+        num_workers: Number of transcriptions the model can run in parallel
+
+    Returns:
+        Loaded WhisperModel
+
+    Raises:
+        ImportError: If faster-whisper is not installed
+    """
+    try:
+        from faster_whisper import WhisperModel
+    except ImportError as e:
+        raise ImportError("faster-whisper is required for local transcription (api_key='local')") from e
+
+    return WhisperModel(
+        model_name,
+        device="auto",
+        compute_type="int8",
+        num_workers=num_workers
+    )
 
 class AudioEmotionAnalyzer:
-    def __init__(self, api_key: Optional[str] = None, openai_api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        openai_api_key: Optional[str] = None,
+        whisper_model_name: str = "small",
+        whisper_num_workers: int = 4
+    ):
         """
         Initialize audio emotion analyzer using AssemblyAI (or simulation)
         and OpenAI for transcript analysis.
 
         Args:
-            api_key: AssemblyAI API key (or "dummy" for simulation)
+            api_key: AssemblyAI API key ("dummy" for simulation, "local" to
+                transcribe on this machine with faster-whisper)
             openai_api_key: OpenAI API key. If None, will use environment variable.
+            whisper_model_name: faster-whisper model size used when api_key is "local"
+            whisper_num_workers: Worker threads of the local model, i.e. how many files
+                transcribe_batch decodes in parallel
         """
         self.api_key = api_key or os.environ.get("ASSEMBLYAI_API_KEY")
         self.openai_api_key = openai_api_key or os.environ.get("OPENAI_API_KEY")
 
+        # Local int8 Whisper model instead of the transcription API round-trip
+        self._whisper = None
+        if self.api_key == "local":
+            self._whisper = _load_whisper_model(whisper_model_name, whisper_num_workers)
+
         # Configure OpenAI client
         if self.openai_api_key != "dummy":
-            self.client = OpenAI(api_key=self.openai_api_key)
+            self.client = get_async_client(self.openai_api_key)
         else:
             self.client = None
 
-    def _transcribe_audio(self, audio_path: str) -> str:
+        # Emotion scores keyed by transcript hash, so repeated transcripts skip the API
+        self._emotion_cache = LRUCache(maxsize=1024)
+
+    def _transcribe_local(self, audio_path: str) -> str:
+        """
+        Transcribe audio file with the local faster-whisper model.
+
+        Args:
+            audio_path: Path to audio file
+
+        Returns:
+            Transcribed text
+        """
+        segments, _ = self._whisper.transcribe(audio_path, beam_size=1, vad_filter=True)
+        return " ".join(segment.text.strip() for segment in segments)
+
+    async def _transcribe_audio(self, audio_path: str) -> str:
         """
-        Transcribe audio file using OpenAI's Whisper API or simulate.
+        Transcribe audio file using local faster-whisper, OpenAI's Whisper API, or simulate.
 
         Args:
             audio_path: Path to audio file
@@ -42,8 +162,12 @@ class AudioEmotionAnalyzer:
         # Use OpenAI for transcription in this implementation
         # In a real implementation, you might use AssemblyAI
         try:
+            if self._whisper is not None:
+                # CPU-bound decoding runs in a worker thread
+                return await asyncio.to_thread(self._transcribe_local, audio_path)
+
             with open(audio_path, "rb") as audio_file:
-                transcript = self.client.audio.transcriptions.create(
+                transcript = await self.client.audio.transcriptions.create(
                     model="whisper-1",
                     file=audio_file
                 )
@@ -52,7 +176,23 @@ class AudioEmotionAnalyzer:
             # Fallback in case of errors
             return "Error transcribing audio. Using fallback text for analysis."
 
-    def analyze(self, audio_path: str) -> Dict[str, float]:
+    async def transcribe_batch(self, audio_paths: List[str]) -> List[str]:
+        """
+        Transcribe several audio files concurrently.
+
+        With a local model the files are decoded in parallel worker threads
+        (the model is loaded with whisper_num_workers workers); otherwise the API requests
+        are in flight at the same time.
+
+        Args:
+            audio_paths: Paths to audio files
+
+        Returns:
+            Transcribed text for each file, in input order
+        """
+        return list(await asyncio.gather(*(self._transcribe_audio(path) for path in audio_paths)))
+
+    async def analyze(self, audio_path: str) -> Dict[str, float]:
         """
         Given a path to an audio file (or simulated), returns a mapping
         from emotion label → confidence score.
@@ -65,73 +205,155 @@ class AudioEmotionAnalyzer:
         """
         # Return dummy data for testing
         if self.api_key == "dummy" and self.openai_api_key == "dummy":
-            return {
-                "joy": 0.7,
-                "sadness": 0.1,
-                "anger": 0.1,
-                "fear": 0.05,
-                "surprise": 0.05,
-                "disgust": 0.0,
-                "neutral": 0.0
-            }
+            return dict(_DUMMY_SCORES)
 
         # Transcribe audio to text
-        transcript = self._transcribe_audio(audio_path)
+        transcript = await self._transcribe_audio(audio_path)
 
-        # If we have no transcript or in dummy mode, return dummy data
-        if not transcript:
-            return {
-                "neutral": 1.0,
-                "joy": 0.0,
-                "sadness": 0.0,
-                "anger": 0.0,
-                "fear": 0.0,
-                "surprise": 0.0,
-                "disgust": 0.0
-            }
+        return await self._analyze_transcript(transcript)
 
-        # Use OpenAI to analyze emotions in the transcript
-        system_prompt = """
-        You are an expert in emotion analysis. Analyze the following audio transcript and determine the emotional content.
-        Return a JSON object with the following emotions and their corresponding confidence scores (0.0-1.0):
-        - joy
-        - sadness
-        - anger
-        - fear
-        - surprise
-        - disgust
-        - neutral
+    async def _analyze_transcript(self, transcript: str) -> Dict[str, float]:
+        """
+        Score the emotions in a single transcript.
 
-        The scores should sum to 1.0.
-        Only return the JSON object, nothing else.
+        Args:
+            transcript: Transcribed text
+
+        Returns:
+            Dictionary mapping emotion labels to confidence scores
         """
+        # If we have no transcript, return neutral scores
+        if not transcript:
+            return dict(_NEUTRAL_SCORES)
 
-        # Make API call
-        response = self.client.chat.completions.create(
+        # Serve repeated transcripts from the cache
+        cache_key = content_hash(transcript)
+        cached = self._emotion_cache.get(cache_key)
+        if cached is not None:
+            return dict(cached)
+
+        # Use OpenAI to analyze emotions in the transcript
+        response = await self.client.chat.completions.create(
             model="gpt-3.5-turbo",
             messages=[
-                {"role": "system", "content": system_prompt},
+                {"role": "system", "content": _TRANSCRIPT_SYSTEM_PROMPT},
                 {"role": "user", "content": f"Audio transcript: {transcript}"}
             ],
             temperature=0.0,
-            response_format={"type": "json_object"}
+            response_format={"type": "json_object"},
+            # Same key for every call so the static system prompt prefix hits the prompt cache
+            extra_body={"prompt_cache_key": "cooper-audio-emotion"}
         )
 
         # Extract and parse JSON from response
         try:
-            result = json.loads(response.choices[0].message.content)
-            # Ensure all values are floats
+            result = orjson.loads(response.choices[0].message.content)
+            # Ensure all values are floats (orjson keeps integral scores such as 1 as int)
             for key in result:
                 result[key] = float(result[key])
+            self._emotion_cache.set(cache_key, dict(result))
             return result
-        except (json.JSONDecodeError, AttributeError, IndexError) as e:
+        except (orjson.JSONDecodeError, AttributeError, IndexError) as e:
             # Fallback in case of parsing errors
-            return {
-                "neutral": 1.0,
-                "joy": 0.0,
-                "sadness": 0.0,
-                "anger": 0.0,
-                "fear": 0.0,
-                "surprise": 0.0,
-                "disgust": 0.0
-            }
+            return dict(_NEUTRAL_SCORES)
+
+    async def analyze_many(self, transcripts: List[str]) -> List[Dict[str, float]]:
+        """
+        Score the emotions in several transcripts with as few API calls as possible.
+
+        Uncached transcripts are packed into batched chat requests (bounded by
+        MAX_BATCH_CHARS), and the batches are sent concurrently.
+
+        Args:
+            transcripts: Transcribed texts to analyze
+
+        Returns:
+            One dictionary of emotion scores per transcript, in input order
+        """
+        # Return dummy data for testing
+        if self.client is None:
+            return [dict(_DUMMY_SCORES) for _ in transcripts]
+
+        results: List[Optional[Dict[str, float]]] = [None] * len(transcripts)
+        pending: List[int] = []
+
+        for i, transcript in enumerate(transcripts):
+            if not transcript:
+                results[i] = dict(_NEUTRAL_SCORES)
+                continue
+
+            cached = self._emotion_cache.get(content_hash(transcript))
+            if cached is not None:
+                results[i] = dict(cached)
+            else:
+                pending.append(i)
+
+        # Group pending transcripts into batches that fit the size budget
+        batches: List[List[int]] = []
+        batch_chars = 0
+        for i in pending:
+            if not batches or batch_chars + len(transcripts[i]) > MAX_BATCH_CHARS:
+                batches.append([])
+                batch_chars = 0
+            batches[-1].append(i)
+            batch_chars += len(transcripts[i])
+
+        batch_scores = await asyncio.gather(*(
+            self._analyze_batch([transcripts[i] for i in batch]) for batch in batches
+        ))
+
+        for batch, scores in zip(batches, batch_scores):
+            for i, score in zip(batch, scores):
+                results[i] = score
+
+        return results
+
+    async def _analyze_batch(self, transcripts: List[str]) -> List[Dict[str, float]]:
+        """
+        Score several transcripts with a single chat request.
+
+        Falls back to one request per transcript if the response does not
+        contain exactly one result per transcript.
+
+        Args:
+            transcripts: Non-empty transcripts to analyze
+
+        Returns:
+            One dictionary of emotion scores per transcript, in input order
+        """
+        if len(transcripts) == 1:
+            return [await self._analyze_transcript(transcripts[0])]
+
+        user_content = "\n\n".join(
+            f"Audio transcript {n}: {transcript}" for n, transcript in enumerate(transcripts, start=1)
+        )
+
+        # Make API call
+        response = await self.client.chat.completions.create(
+            model="gpt-3.5-turbo",
+            messages=[
+                {"role": "system", "content": _BATCH_SYSTEM_PROMPT},
+                {"role": "user", "content": user_content}
+            ],
+            temperature=0.0,
+            response_format={"type": "json_object"},
+            # Same key for every call so the static system prompt prefix hits the prompt cache
+            extra_body={"prompt_cache_key": "cooper-audio-emotion-batch"}
+        )
+
+        # Extract and parse JSON from response
+        try:
+            items = orjson.loads(response.choices[0].message.content)["results"]
+            if len(items) != len(transcripts):
+                raise ValueError("Result count does not match transcript count")
+            scores = [{key: float(value) for key, value in item.items()} for item in items]
+        except (ValueError, AttributeError, IndexError, KeyError, TypeError):
+            # Malformed or mismatched batch response: analyze each transcript on its own
+            return list(await asyncio.gather(*(
+                self._analyze_transcript(transcript) for transcript in transcripts
+            )))
+
+        for transcript, score in zip(transcripts, scores):
+            self._emotion_cache.set(content_hash(transcript), dict(score))
+
+        return scores
@@ -1,6 +1,7 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Mapping, Optional
 import statistics
-from src.scraper import VideoData
+import numpy as np
+from src.scraper import VideoData, METADATA_FIELDS
 
 class Correlator:
     def __init__(self):
@@ -11,15 +12,23 @@ class Correlator:
             "joy", "sadness", "anger", "fear",
             "surprise", "disgust", "neutral"
         ]
-        self.metadata_fields = [
-            "likes", "comments", "shares", "views"
+        # Same column order as src.scraper.metadata_matrix
+        self.metadata_fields = list(METADATA_FIELDS)
+
+        # The output key schema is static, so build it once
+        self._pair_keys = [
+            f"{emotion}_vs_{field}"
+            for emotion in self.emotions
+            for field in self.metadata_fields
         ]
+        self._comment_keys = [f"{emotion}_comment_ratio" for emotion in self.emotions]
 
     def compute(
         self,
         video_data: List[VideoData],
-        text_scores: Dict[str, float],
-        audio_scores: Dict[str, float]
+        text_scores: Mapping[str, float],
+        audio_scores: Dict[str, float],
+        metadata_matrix: Optional[np.ndarray] = None
     ) -> Dict[str, float]:
         """
         Given scraped VideoData and emotion-score dicts,
@@ -27,55 +36,55 @@ class Correlator:
 
         Args:
             video_data: List of VideoData objects containing metadata
-            text_scores: Dictionary of emotion scores from text analysis
+            text_scores: Mapping of emotion scores from text analysis
             audio_scores: Dictionary of emotion scores from audio analysis
+            metadata_matrix: Optional precomputed (videos × fields) array from
+                src.scraper.metadata_matrix; skips per-video metadata lookups
 
         Returns:
             Dictionary of correlation metrics between emotions and metadata
         """
-        results = {}
-
-        # Merge emotion scores (simple average)
-        combined_scores = {}
-        for emotion in self.emotions:
-            text_value = text_scores.get(emotion, 0.0)
-            audio_value = audio_scores.get(emotion, 0.0)
-            combined_scores[emotion] = (text_value + audio_value) / 2
-
-        # Extract metadata averages from videos
-        metadata_values = {field: 0.0 for field in self.metadata_fields}
         video_count = len(video_data)
 
         if video_count == 0:
             return {}
 
-        # Calculate average values for each metadata field
-        for video in video_data:
-            for field in self.metadata_fields:
-                if field in video.metadata:
-                    metadata_values[field] += float(video.metadata.get(field, 0))
+        # Merge emotion scores (simple average)
+        combined_scores = np.array(
+            [
+                (text_scores.get(emotion, 0.0) + audio_scores.get(emotion, 0.0)) / 2
+                for emotion in self.emotions
+            ],
+            dtype=np.float64
+        )
+
+        if metadata_matrix is not None:
+            comment_count = sum(len(video.comments) for video in video_data)
+        else:
+            # Metadata as a (videos × fields) matrix, plus the total comment count,
+            # gathered in a single pass over the videos; missing fields count as 0
+            metadata_matrix = np.empty((video_count, len(self.metadata_fields)), dtype=np.float64)
+            comment_count = 0
+            for row, video in zip(metadata_matrix, video_data):
+                metadata = video.metadata
+                row[:] = [float(metadata.get(field, 0)) for field in self.metadata_fields]
+                comment_count += len(video.comments)
 
-        # Calculate averages
-        for field in metadata_values:
-            metadata_values[field] /= video_count
+        # Calculate average values for each metadata field (accumulate in float64)
+        metadata_means = metadata_matrix.mean(axis=0, dtype=np.float64)
 
         # Calculate correlations between emotions and metadata
-        for emotion in combined_scores:
-            for field in metadata_values:
-                if metadata_values[field] > 0:
-                    # Simple ratio calculation: emotion_score / metadata_value
-                    # Higher ratio = stronger correlation
-                    correlation = combined_scores[emotion] / metadata_values[field]
-                    results[f"{emotion}_vs_{field}"] = round(correlation * 100, 2)
-                else:
-                    results[f"{emotion}_vs_{field}"] = 0.0
+        # Simple ratio calculation: emotion_score / metadata_value
+        # Higher ratio = stronger correlation; non-positive averages give 0.0
+        positive = metadata_means > 0
+        safe_means = np.where(positive, metadata_means, 1.0)
+        ratios = np.where(positive, np.divide.outer(combined_scores, safe_means) * 100, 0.0)
+
+        results = dict(zip(self._pair_keys, np.round(ratios, 2).ravel().tolist()))
 
         # Add additional metrics: comment sentiment per emotion
-        comment_count = sum(len(video.comments) for video in video_data)
         if comment_count > 0:
-            for emotion in combined_scores:
-                results[f"{emotion}_comment_ratio"] = round(
-                    combined_scores[emotion] * 100 / comment_count, 2
-                )
+            comment_ratios = np.round(combined_scores * 100 / comment_count, 2)
+            results.update(zip(self._comment_keys, comment_ratios.tolist()))
 
         return results
@@ -1,23 +1,124 @@
-from typing import List, Dict, Optional
+from typing import TYPE_CHECKING, List, Dict, Optional, Tuple
+from functools import lru_cache
+import asyncio
+import importlib.util
 import os
-import json
-from openai import OpenAI
+import re
+import threading
+import numpy as np
+import orjson
+from src.openai_client import get_async_client
+from src.cache import LRUCache, content_hash
+
+if TYPE_CHECKING:
+    import pinecone
+    from sentence_transformers import SentenceTransformer
+
+# Optional vector-search dependencies; only probed here and imported on first use,
+# so dummy/test mode never pays for loading torch or the Pinecone client
+SENTENCE_TRANSFORMERS_AVAILABLE = importlib.util.find_spec("sentence_transformers") is not None
+PINECONE_AVAILABLE = importlib.util.find_spec("pinecone") is not None
+
+# Paragraph separator: a blank line, including lines holding only whitespace
+_PARAGRAPH_SEPARATOR = re.compile(r"\n\s*\n")
+
+# Fixed query used to retrieve tone-of-voice guidelines for PR hooks
+TONE_GUIDELINE_QUERY = "brand voice tone PR hooks"
+
+# System prompt for insight generation
+_INSIGHTS_SYSTEM_PROMPT = """
+You are an expert content marketing analyst. Your job is to generate insightful,
+data-driven observations based on emotion analysis and engagement metrics.
+
+Analyze the correlation data provided and generate specific, actionable insights
+that align with the brand guidelines. Focus on clear patterns and relationships
+between emotional content and audience engagement.
+
+Each insight should:
+1. Identify a specific correlation or pattern
+2. Explain its significance
+3. Be concise and actionable
+4. Align with brand guidelines where relevant
+
+You MUST return your response as a valid JSON object with this exact format:
+{"insights": ["Insight 1", "Insight 2", ...]}
+"""
+
+# System prompt for PR hook suggestions
+_PR_HOOKS_SYSTEM_PROMPT = """
+You are an expert PR consultant who specializes in crafting compelling hooks and headlines
+that align perfectly with a brand's voice and tone. You have experise in difficult brand backlashes and crises.
+
+Based on the provided insights and brand guidelines, create PR hooks that:
+1. Capture the essence of the insights
+2. Use language that matches the brand voice
+3. Are attention-grabbing and shareable
+4. Would perform well on social media and press releases
 
-# Try to import sentence-transformers, fallback gracefully
-try:
+You MUST return your response as a valid JSON object with this exact format:
+{"hooks": ["Hook 1", "Hook 2", ...]}
+"""
+
+# Guideline sets up to this many chunks are searched in memory instead of Pinecone
+LOCAL_SEARCH_MAX_CHUNKS = 10_000
+
+# Vectors sent per Pinecone upsert request
+UPSERT_BATCH_SIZE = 100
+
+
+# Opt-in int8 dynamic quantization of the embedder for faster CPU inference
+USE_INT8_EMBEDDER = os.environ.get("USE_INT8_EMBEDDER", "").lower() in ("1", "true", "yes")
+
+
+def _quantize_int8(model: "SentenceTransformer") -> "SentenceTransformer":
+    """Quantize the model's linear layers to int8 weights for CPU inference."""
+    import torch
+
+    return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+@lru_cache(maxsize=4)
+def _get_embedder(name: str) -> "SentenceTransformer":
+    """Load a sentence transformer once per process and model name."""
     from sentence_transformers import SentenceTransformer
-    SENTENCE_TRANSFORMERS_AVAILABLE = True
-except ImportError:
-    SENTENCE_TRANSFORMERS_AVAILABLE = False
 
-# Try to import pinecone, fallback gracefully
-try:
+    model = SentenceTransformer(name)
+    if USE_INT8_EMBEDDER:
+        model = _quantize_int8(model)
+    return model
+
+
+@lru_cache(maxsize=4)
+def _get_pinecone_index(api_key: str, environment: str, index_name: str, dimension: int) -> "pinecone.Index":
+    """Connect to a Pinecone index once per process, creating it if needed."""
     import pinecone
-    PINECONE_AVAILABLE = True
-except ImportError:
-    PINECONE_AVAILABLE = False
+
+    pinecone.init(api_key=api_key, environment=environment)
+
+    # Create index if it doesn't exist
+    if index_name not in pinecone.list_indexes():
+        pinecone.create_index(name=index_name, dimension=dimension, metric="cosine")
+
+    return pinecone.Index(index_name)
+
+
+def _format_correlations(correlations: Dict[str, float]) -> str:
+    """Render correlations as "name: value" lines, used both for search and the prompt."""
+    return "\n".join([f"{k}: {v}" for k, v in correlations.items()])
+
+
+def _insight_cache_key(correlations: Dict[str, float], n_insights: int) -> str:
+    """Key insights by content so the same correlations in any order share an entry."""
+    return content_hash(sorted(correlations.items()), n_insights)
+
 
 class InsightGenerator:
+    # Seconds a cached insight or PR hook list stays valid
+    CACHE_TTL_SEC = 3600
+
+    # Seconds a search waits for the background index build before falling back
+    INDEX_READY_TIMEOUT_SEC = 30
+
     def __init__(
         self,
         brand_guidelines: str,
@@ -25,7 +126,8 @@ class InsightGenerator:
         pinecone_api_key: Optional[str] = None,
         openai_api_key: Optional[str] = None,
         pinecone_index_name: str = "brand-guidelines",
-        pinecone_environment: str = "gcp-starter"
+        pinecone_environment: str = "gcp-starter",
+        vector_search: bool = True
     ):
         """
         Initialize guideline text and embedder model.
@@ -37,6 +139,8 @@ class InsightGenerator:
             openai_api_key: OpenAI API key, or None to use env var
             pinecone_index_name: Name of the Pinecone index to use
             pinecone_environment: Pinecone environment (e.g., 'gcp-starter')
+            vector_search: Load the embedder and index the guidelines in the background;
+                if False, searches always return the first guideline chunks
         """
         # Initialize API keys
         self.pinecone_api_key = pinecone_api_key or os.environ.get("PINECONE_API_KEY")
@@ -52,46 +156,62 @@ class InsightGenerator:
         self._embedder = None
         self._index = None
 
-        # Only try to initialize if dependencies are available and valid API key provided
-        if (SENTENCE_TRANSFORMERS_AVAILABLE and PINECONE_AVAILABLE and
-                self.pinecone_api_key and self.pinecone_api_key != "dummy"):
-            try:
-                self._embedder = SentenceTransformer(vector_model_name)
-
-                # Initialize Pinecone
-                pinecone.init(
-                    api_key=self.pinecone_api_key,
-                    environment=self.pinecone_environment
-                )
-
-                # Create index if it doesn't exist
-                if self.pinecone_index_name not in pinecone.list_indexes():
-                    pinecone.create_index(
-                        name=self.pinecone_index_name,
-                        dimension=self._embedder.get_sentence_embedding_dimension(),
-                        metric="cosine"
-                    )
-
-                # Connect to index
-                self._index = pinecone.Index(self.pinecone_index_name)
-
-                # Add guideline chunks to index if not in test mode
-                self._add_guidelines_to_index()
-            except Exception as e:
-                # Fallback to dummy mode if error occurs
-                print(f"Error initializing vector search: {e}")
-                self._embedder = None
-                self._index = None
+        # L2-normalized chunk embeddings for in-memory search (small guideline sets)
+        self._guideline_mat: Optional[np.ndarray] = None
+
+        # Caches for repeated queries, correlation sets and insight lists
+        self._query_embedding_cache = LRUCache(maxsize=1024)
+        self._insight_cache = LRUCache(maxsize=256, ttl=self.CACHE_TTL_SEC)
+        self._hook_cache = LRUCache(maxsize=256, ttl=self.CACHE_TTL_SEC)
+
+        # Set once vector search is initialized (or known to be unavailable)
+        self._index_ready = threading.Event()
+
+        # Small guideline sets are searched in memory and need only the embedder; larger
+        # ones also need Pinecone. Loading the model and embedding the guidelines can take
+        # seconds, so it runs in a background thread and searches wait for it instead of
+        # blocking the constructor.
+        local_search = len(self._guideline_chunks) <= LOCAL_SEARCH_MAX_CHUNKS
+        pinecone_search = PINECONE_AVAILABLE and bool(self.pinecone_api_key)
+        if (vector_search and SENTENCE_TRANSFORMERS_AVAILABLE and self._guideline_chunks and
+                self.pinecone_api_key != "dummy" and (local_search or pinecone_search)):
+            threading.Thread(
+                target=self._init_vector_search,
+                args=(vector_model_name,),
+                name="guideline-index",
+                daemon=True
+            ).start()
         else:
-            self._embedder = None
-            self._index = None
+            self._index_ready.set()
 
         # Initialize OpenAI client if valid API key provided
         if self.openai_api_key and self.openai_api_key != "dummy":
-            self.client = OpenAI(api_key=self.openai_api_key)
+            self.client = get_async_client(self.openai_api_key)
         else:
             self.client = None
 
+    def _init_vector_search(self, vector_model_name: str) -> None:
+        """
+        Load the embedder and index the guideline chunks.
+
+        Runs in a background thread started by __init__; falls back to dummy mode on error.
+        Nothing is published until the index is complete, and searches only read it once
+        _index_ready is set, so a search never sees a half-built index.
+
+        Args:
+            vector_model_name: Name of the sentence transformer model
+        """
+        try:
+            # Model weights are shared across instances
+            embedder = _get_embedder(vector_model_name)
+            guideline_mat, index = self._build_guideline_index(embedder)
+            self._embedder, self._guideline_mat, self._index = embedder, guideline_mat, index
+        except Exception as e:
+            # Fallback to dummy mode if error occurs
+            print(f"Error initializing vector search: {e}")
+        finally:
+            self._index_ready.set()
+
     def _parse_guidelines(self, guidelines: str) -> List[str]:
         """
         Split guidelines into digestible chunks.
@@ -104,42 +224,85 @@ class InsightGenerator:
         """
         # Simple paragraph-based splitting
         # NOTE: For very long guidelines, consider token-based chunking instead
-        paragraphs = guidelines.split("\n\n")
-        chunks = []
+        return [chunk for chunk in (para.strip() for para in _PARAGRAPH_SEPARATOR.split(guidelines)) if chunk]
 
-        for para in paragraphs:
-            if para.strip():
-                chunks.append(para.strip())
+    def _build_guideline_index(
+        self,
+        embedder: "SentenceTransformer"
+    ) -> Tuple[Optional[np.ndarray], Optional["pinecone.Index"]]:
+        """
+        Embed guideline chunks for search.
 
-        return chunks
+        Small guideline sets are kept in memory as a normalized embedding matrix and
+        need no Pinecone connection; only sets larger than LOCAL_SEARCH_MAX_CHUNKS
+        are upserted to Pinecone.
 
-    def _add_guidelines_to_index(self):
-        """Add guideline chunks to Pinecone index."""
-        if not self._embedder or not self._index:
-            return
+        Args:
+            embedder: Model used to embed the chunks
 
-        # Generate embeddings for all chunks
-        if not self._guideline_chunks:
-            return
+        Returns:
+            Tuple of (in-memory embedding matrix, Pinecone index); exactly one is set
+        """
+        # Encode every chunk in one batched forward pass
+        embeddings = np.asarray(
+            embedder.encode(
+                self._guideline_chunks,
+                batch_size=64,
+                convert_to_numpy=True,
+                show_progress_bar=False
+            ),
+            dtype=np.float32
+        )
 
-        vectors = []
+        if len(self._guideline_chunks) <= LOCAL_SEARCH_MAX_CHUNKS:
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            embeddings /= norms
+            return np.ascontiguousarray(embeddings), None
+
+        # The index connection is shared across instances
+        index = _get_pinecone_index(
+            self.pinecone_api_key,
+            self.pinecone_environment,
+            self.pinecone_index_name,
+            embeddings.shape[1]
+        )
 
-        for i, chunk in enumerate(self._guideline_chunks):
-            # Generate embedding
-            embedding = self._embedder.encode(chunk)
+        # Convert the whole matrix to lists in one call, then upsert in fixed-size batches
+        all_values = embeddings.tolist()
+        for start in range(0, len(all_values), UPSERT_BATCH_SIZE):
+            index.upsert(vectors=[
+                {
+                    "id": f"guideline-{i}",
+                    "values": all_values[i],
+                    "metadata": {"text": self._guideline_chunks[i], "source": "brand_guidelines"}
+                }
+                for i in range(start, min(start + UPSERT_BATCH_SIZE, len(all_values)))
+            ])
+        return None, index
+
+    def _vector_search_available(self) -> bool:
+        """Whether a finished index (in memory or in Pinecone) can be searched."""
+        return self._embedder is not None and (self._guideline_mat is not None or self._index is not None)
+
+    def _rank_local(self, scores: np.ndarray, top_k: int) -> List[str]:
+        """
+        Pick the top_k guideline chunks from local similarity scores.
 
-            # Create vector record
-            vector = {
-                "id": f"guideline-{i}",
-                "values": embedding.tolist(),
-                "metadata": {"text": chunk, "source": "brand_guidelines"}
-            }
+        Args:
+            scores: Cosine similarity of the query to every chunk
+            top_k: Number of results to return
 
-            vectors.append(vector)
+        Returns:
+            Guideline chunks ordered by decreasing similarity
+        """
+        k = min(top_k, len(scores))
+        if k <= 0:
+            return []
 
-        # Upsert vectors in batches
-        if vectors:
-            self._index.upsert(vectors=vectors)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [self._guideline_chunks[i] for i in top]
 
     def _search_relevant_guidelines(self, query: str, top_k: int = 3) -> List[str]:
         """
@@ -152,14 +315,26 @@ class InsightGenerator:
         Returns:
             List of matching guideline chunks
         """
-        # In dummy mode or if embedder not available, return the first chunk or empty list
-        if not SENTENCE_TRANSFORMERS_AVAILABLE or not PINECONE_AVAILABLE or not self._embedder or not self._index:
+        # Let a background index build finish before searching; if it is still running
+        # after the timeout, or in dummy mode, return the first chunks instead
+        if not self._index_ready.wait(self.INDEX_READY_TIMEOUT_SEC) or not self._vector_search_available():
             return self._guideline_chunks[:min(top_k, len(self._guideline_chunks))] if self._guideline_chunks else []
 
-        # Generate query embedding
-        query_embedding = self._embedder.encode(query)
-
-        # Search Pinecone
+        # Generate query embedding as a float32 array, reusing it for repeated queries
+        query_embedding = self._query_embedding_cache.get(query)
+        if query_embedding is None:
+            query_embedding = np.ascontiguousarray(
+                self._embedder.encode(query, convert_to_numpy=True), dtype=np.float32
+            )
+            self._query_embedding_cache.set(query, query_embedding)
+
+        # Search the in-memory matrix when the guideline set is small
+        if self._guideline_mat is not None:
+            norm = np.linalg.norm(query_embedding)
+            query_vector = query_embedding / norm if norm > 0 else query_embedding
+            return self._rank_local(self._guideline_mat @ query_vector, top_k)
+
+        # Search Pinecone (its client only accepts plain lists)
         results = self._index.query(
             vector=query_embedding.tolist(),
             top_k=top_k,
@@ -174,10 +349,77 @@ class InsightGenerator:
 
         return matches
 
-    def generate(
+    async def _search_relevant_guidelines_batch(
+        self,
+        queries: List[str],
+        top_k: int = 3
+    ) -> List[List[str]]:
+        """
+        Search for relevant guideline chunks for several queries at once.
+
+        Queries without a cached embedding are embedded in a single batched call,
+        then all are ranked against the in-memory matrix with one matmul, or
+        looked up in Pinecone concurrently.
+
+        Args:
+            queries: Query texts to search for
+            top_k: Number of results to return per query
+
+        Returns:
+            One list of matching guideline chunks per query
+        """
+        if not self._index_ready.is_set():
+            await asyncio.to_thread(self._index_ready.wait, self.INDEX_READY_TIMEOUT_SEC)
+
+        if not self._index_ready.is_set() or not self._vector_search_available():
+            fallback = self._guideline_chunks[:top_k]
+            return [list(fallback) for _ in queries]
+
+        if not queries:
+            return []
+
+        # Reuse cached query embeddings and encode only the misses, in one batch
+        cached = [self._query_embedding_cache.get(query) for query in queries]
+        misses = [i for i, embedding in enumerate(cached) if embedding is None]
+        if misses:
+            # Encoding is CPU-bound, so keep it off the event loop like single-query searches
+            encoded = np.asarray(
+                await asyncio.to_thread(
+                    self._embedder.encode,
+                    [queries[i] for i in misses],
+                    batch_size=32,
+                    convert_to_numpy=True,
+                    show_progress_bar=False
+                ),
+                dtype=np.float32
+            )
+            for i, embedding in zip(misses, encoded):
+                # Copy each row so the cache does not keep the whole batch alive
+                cached[i] = embedding.copy()
+                self._query_embedding_cache.set(queries[i], cached[i])
+        embeddings = np.stack(cached)
+
+        if self._guideline_mat is not None:
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            scores = (embeddings / norms) @ self._guideline_mat.T
+            return [self._rank_local(row, top_k) for row in scores]
+
+        results = await asyncio.gather(*(
+            asyncio.to_thread(self._index.query, vector=values, top_k=top_k, include_metadata=True)
+            for values in embeddings.tolist()
+        ))
+
+        return [
+            [match.metadata["text"] for match in result.matches if match.metadata and "text" in match.metadata]
+            for result in results
+        ]
+
+    async def generate(
         self,
         correlations: Dict[str, float],
-        n_insights: int = 2
+        n_insights: int = 2,
+        guidelines: Optional[List[str]] = None
     ) -> List[str]:
         """
         Generate n_insights based on correlations and guidelines.
@@ -185,6 +427,7 @@ class InsightGenerator:
         Args:
             correlations: Dictionary of correlation metrics
             n_insights: Number of insights to generate
+            guidelines: Guideline chunks already retrieved for the correlations, or None to search
 
         Returns:
             List of insight strings
@@ -197,32 +440,21 @@ class InsightGenerator:
                 "Neutral content performs better for long-term viewer retention."
             ][:n_insights]
 
+        # Identical correlation sets produce the same prompt, so reuse earlier results
+        cache_key = _insight_cache_key(correlations, n_insights)
+        cached = self._insight_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
+
         # Convert correlations to text for search
-        correlation_text = "\n".join([f"{k}: {v}" for k, v in correlations.items()])
+        correlation_text = _format_correlations(correlations)
 
-        # Search for relevant guideline chunks
-        relevant_guidelines = self._search_relevant_guidelines(correlation_text)
-        guidelines_text = "\n\n".join(relevant_guidelines)
+        # Search for relevant guideline chunks unless the caller prefetched them
+        if guidelines is None:
+            guidelines = await asyncio.to_thread(self._search_relevant_guidelines, correlation_text)
+        guidelines_text = "\n\n".join(guidelines)
 
         # Prepare prompt for OpenAI
-        system_prompt = """
-        You are an expert content marketing analyst. Your job is to generate insightful,
-        data-driven observations based on emotion analysis and engagement metrics.
-
-        Analyze the correlation data provided and generate specific, actionable insights
-        that align with the brand guidelines. Focus on clear patterns and relationships
-        between emotional content and audience engagement.
-
-        Each insight should:
-        1. Identify a specific correlation or pattern
-        2. Explain its significance
-        3. Be concise and actionable
-        4. Align with brand guidelines where relevant
-
-        You MUST return your response as a valid JSON object with this exact format:
-        {"insights": ["Insight 1", "Insight 2", ...]}
-        """
-
         user_content = f"""
         CORRELATION DATA:
         {correlation_text}
@@ -235,25 +467,29 @@ class InsightGenerator:
         """
 
         # Make API call
-        response = self.client.chat.completions.create(
+        response = await self.client.chat.completions.create(
             model="gpt-4",
             messages=[
-                {"role": "system", "content": system_prompt},
+                {"role": "system", "content": _INSIGHTS_SYSTEM_PROMPT},
                 {"role": "user", "content": user_content}
             ],
-            temperature=0.7
+            temperature=0.7,
+            # Same key for every call so the static system prompt prefix hits the prompt cache
+            extra_body={"prompt_cache_key": "cooper-insights"}
         )
 
         # Extract and parse insights
         try:
-            result = json.loads(response.choices[0].message.content)
+            result = orjson.loads(response.choices[0].message.content)
             insights = result.get("insights", [])
 
             # Ensure we have the right number of insights
             if not insights and isinstance(result, list):
                 insights = result
 
-            return insights[:n_insights]
+            insights = insights[:n_insights]
+            self._insight_cache.set(cache_key, list(insights))
+            return insights
         except Exception:
             # Fallback insights
             return [
@@ -261,10 +497,51 @@ class InsightGenerator:
                 f"There appears to be a relationship between emotions and engagement metrics."
             ][:n_insights]
 
-    def suggest_pr_hooks(
+    async def generate_with_hooks(
         self,
-        insights: List[str],
+        correlations: Dict[str, float],
+        n_insights: int = 2,
         n_hooks: int = 2
+    ) -> Tuple[List[str], List[str]]:
+        """
+        Generate insights and matching PR hooks in one pipeline.
+
+        The tone guidelines used for PR hooks do not depend on the insights, so
+        they are retrieved together with the correlation guidelines in one
+        batched search before the insights are generated. Cached insights skip
+        that search.
+
+        Args:
+            correlations: Dictionary of correlation metrics
+            n_insights: Number of insights to generate
+            n_hooks: Number of PR hooks to suggest
+
+        Returns:
+            Tuple of (insights, PR hooks)
+        """
+        if not self.client:
+            insights = await self.generate(correlations, n_insights)
+            return insights, await self.suggest_pr_hooks(insights, n_hooks)
+
+        # A repeated request is answered from the result caches; suggest_pr_hooks
+        # checks its own cache and only searches the tone guidelines on a miss
+        cached = self._insight_cache.get(_insight_cache_key(correlations, n_insights))
+        if cached is not None:
+            insights = list(cached)
+            return insights, await self.suggest_pr_hooks(insights, n_hooks)
+
+        correlation_guidelines, tone_guidelines = await self._search_relevant_guidelines_batch(
+            [_format_correlations(correlations), TONE_GUIDELINE_QUERY]
+        )
+        insights = await self.generate(correlations, n_insights, guidelines=correlation_guidelines)
+        hooks = await self.suggest_pr_hooks(insights, n_hooks, guidelines=tone_guidelines)
+        return insights, hooks
+
+    async def suggest_pr_hooks(
+        self,
+        insights: List[str],
+        n_hooks: int = 2,
+        guidelines: Optional[List[str]] = None
     ) -> List[str]:
         """
         Suggest n_hooks PR hooks aligned to brand tone.
@@ -272,6 +549,7 @@ class InsightGenerator:
         Args:
             insights: List of insight strings
             n_hooks: Number of PR hooks to suggest
+            guidelines: Tone guideline chunks already retrieved, or None to search for them
 
         Returns:
             List of PR hook strings
@@ -283,26 +561,18 @@ class InsightGenerator:
                 "How we increased engagement by 40% with one simple emotional trigger"
             ][:n_hooks]
 
-        # Search for tone-related guideline chunks
-        relevant_guidelines = self._search_relevant_guidelines("brand voice tone PR hooks")
-        guidelines_text = "\n\n".join(relevant_guidelines)
+        # The same insights produce the same prompt, so reuse earlier hooks
+        cache_key = content_hash(list(insights), n_hooks)
+        cached = self._hook_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
 
-        # Prepare prompt for OpenAI
-        system_prompt = """
-        You are an expert PR consultant who specializes in crafting compelling hooks and headlines
-        that align perfectly with a brand's voice and tone. You have experise in difficult brand backlashes and crises.
-
-        Based on the provided insights and brand guidelines, create PR hooks that:
-        1. Capture the essence of the insights
-        2. Use language that matches the brand voice
-        3. Are attention-grabbing and shareable
-        4. Would perform well on social media and press releases
-
-        You MUST return your response as a valid JSON object with this exact format:
-        {"hooks": ["Hook 1", "Hook 2", ...]}
-        """
+        # Search for tone-related guideline chunks unless the caller prefetched them
+        if guidelines is None:
+            guidelines = await asyncio.to_thread(self._search_relevant_guidelines, TONE_GUIDELINE_QUERY)
+        guidelines_text = "\n\n".join(guidelines)
 
-        # Join insights into a single string
+        # Prepare prompt for OpenAI, joining insights into a single string
         insights_text = "\n".join([f"- {insight}" for insight in insights])
 
         user_content = f"""
@@ -317,25 +587,29 @@ class InsightGenerator:
         """
 
         # Make API call
-        response = self.client.chat.completions.create(
+        response = await self.client.chat.completions.create(
             model="gpt-4",
             messages=[
-                {"role": "system", "content": system_prompt},
+                {"role": "system", "content": _PR_HOOKS_SYSTEM_PROMPT},
                 {"role": "user", "content": user_content}
             ],
-            temperature=0.8
+            temperature=0.8,
+            # Same key for every call so the static system prompt prefix hits the prompt cache
+            extra_body={"prompt_cache_key": "cooper-pr-hooks"}
         )
 
         # Extract and parse hooks
         try:
-            result = json.loads(response.choices[0].message.content)
+            result = orjson.loads(response.choices[0].message.content)
             hooks = result.get("hooks", [])
 
             # Ensure we have the right number of hooks
             if not hooks and isinstance(result, list):
                 hooks = result
 
-            return hooks[:n_hooks]
+            hooks = hooks[:n_hooks]
+            self._hook_cache.set(cache_key, list(hooks))
+            return hooks
         except Exception:
             # Fallback hooks
             return [
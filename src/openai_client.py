@@ -0,0 +1,30 @@
+from typing import TYPE_CHECKING
+from functools import lru_cache
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
+
+@lru_cache(maxsize=None)
+def get_async_client(api_key: str) -> "AsyncOpenAI":
+    """
+    Return the process-wide async OpenAI client for an API key.
+
+    Sharing one client keeps a single HTTP/2 connection pool alive across
+    analyzer instances and requests, so calls reuse warm connections.
+    openai is imported on first use so dummy/test mode never pays its import cost.
+
+    Args:
+        api_key: OpenAI API key
+
+    Returns:
+        AsyncOpenAI client bound to a pooled httpx.AsyncClient
+    """
+    import httpx
+    from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+    http_client = DefaultAsyncHttpxClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+    )
+    return AsyncOpenAI(api_key=api_key, http_client=http_client)
@@ -1,8 +1,22 @@
-from typing import List, Dict, Any, Optional, Union
-from pydantic import BaseModel, Field, ValidationError
+from typing import Awaitable, Callable, List, Dict, Any, Optional
+from pydantic import BaseModel, TypeAdapter
+import asyncio
+import base64
+import hmac
+import math
+import os
+import random
 import time
 import httpx
-from apify_client import ApifyClient
+import numpy as np
+import orjson
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
 
 # --- Models ---
 
@@ -20,6 +34,117 @@ class VideoData(BaseModel):
     metadata: Dict[str, Any]
 
 
+# Validates a whole list of items in one call to pydantic's compiled validator
+_VIDEO_LIST_ADAPTER = TypeAdapter(List[VideoData])
+
+
+# Numeric metadata columns, in the order used by metadata_matrix
+METADATA_FIELDS = ("likes", "comments", "shares", "views")
+
+
+def metadata_matrix(videos: List[VideoData]) -> np.ndarray:
+    """
+    Stack video metadata into a (videos × METADATA_FIELDS) float64 array.
+
+    Building the array once lets consumers reduce over all videos with a
+    single vectorized call instead of per-video dict lookups. float64 keeps
+    large counts (e.g. views beyond 2**24) exact.
+
+    :param videos: Scraped videos
+    :return: Array of shape (len(videos), len(METADATA_FIELDS)); missing fields are 0
+    """
+    matrix = np.zeros((len(videos), len(METADATA_FIELDS)), dtype=np.float64)
+    for row, video in zip(matrix, videos):
+        metadata = video.metadata
+        row[:] = [float(metadata.get(field, 0)) for field in METADATA_FIELDS]
+    return matrix
+
+
+# Apify REST API host; every non-webhook request goes to it
+APIFY_API_URL = "https://api.apify.com"
+
+
+# Items fetched per dataset page request
+DATASET_PAGE_SIZE = 1000
+
+# Longest run Apify's run-sync endpoints wait for; longer jobs are started and awaited
+SYNC_RUN_MAX_SECS = 300
+
+# Extra seconds the HTTP client waits for a run-sync response beyond the run timeout
+SYNC_RUN_TIMEOUT_MARGIN = 10
+
+# Headers for request bodies pre-serialized with orjson
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Longest server-side wait Apify allows per run status request
+MAX_WAIT_FOR_FINISH_SECS = 60
+
+# Run events that make Apify call the completion webhook
+RUN_FINISHED_EVENTS = (
+    "ACTOR.RUN.SUCCEEDED",
+    "ACTOR.RUN.FAILED",
+    "ACTOR.RUN.TIMED_OUT",
+    "ACTOR.RUN.ABORTED",
+)
+
+# Header carrying the shared secret on Apify's run-finished webhook requests
+WEBHOOK_SECRET_HEADER = "X-Cooper-Webhook-Secret"
+
+# Run statuses after which a run will not change any more
+_TERMINAL_RUN_STATUSES = {"SUCCEEDED", "FAILED", "TIMED-OUT", "ABORTED"}
+
+
+# Bounded retry policy for transient HTTP failures (429 and 5xx responses)
+RETRY_ATTEMPTS = 5
+RETRY_WAIT_INITIAL = 0.5
+RETRY_WAIT_MAX = 30
+
+
+def _is_transient(exc: BaseException) -> bool:
+    """Whether a failed request is worth retrying."""
+    return isinstance(exc, httpx.HTTPStatusError) and (
+        exc.response.status_code == 429 or exc.response.status_code >= 500
+    )
+
+
+def _retry_wait(retry_state: RetryCallState) -> float:
+    """Honor the server's Retry-After seconds, else back off exponentially with jitter."""
+    exc = retry_state.outcome.exception() if retry_state.outcome else None
+    if isinstance(exc, httpx.HTTPStatusError):
+        retry_after = exc.response.headers.get("Retry-After", "")
+        try:
+            return min(float(retry_after), RETRY_WAIT_MAX)
+        except ValueError:
+            pass
+    return wait_exponential_jitter(initial=RETRY_WAIT_INITIAL, max=RETRY_WAIT_MAX)(retry_state)
+
+
+def _retrying(sleep: Callable[[float], Awaitable[None]] = asyncio.sleep) -> AsyncRetrying:
+    """Retry controller for one logical HTTP request, waiting between attempts with sleep."""
+    return AsyncRetrying(
+        stop=stop_after_attempt(RETRY_ATTEMPTS),
+        wait=_retry_wait,
+        retry=retry_if_exception(_is_transient),
+        reraise=True,
+        sleep=sleep,
+    )
+
+
+def _encode_webhooks(request_url: str, secret: str) -> str:
+    """
+    Encode an ad-hoc run-finished webhook as the base64 JSON Apify expects.
+
+    Apify sends the secret back in WEBHOOK_SECRET_HEADER, so the receiver can
+    tell genuine callbacks from forged ones.
+    """
+    webhooks = [{
+        "eventTypes": list(RUN_FINISHED_EVENTS),
+        "requestUrl": request_url,
+        "headersTemplate": orjson.dumps({WEBHOOK_SECRET_HEADER: secret}).decode(),
+    }]
+    return base64.b64encode(orjson.dumps(webhooks)).decode("ascii")
+
+
 # --- Exceptions ---
 
 class RequestError(Exception):
@@ -35,32 +160,77 @@ class ApifyClientError(Exception):
 class Scraper:
     def __init__(
         self,
-        apify_token: str,
-        actor_task_id: str,
+        apify_token: Optional[str] = None,
+        actor_task_id: Optional[str] = None,
         webhook_url: Optional[str] = None,
         poll_interval: int = 5,
         timeout: int = 300,
+        max_poll_interval: float = 30,
+        callback_url: Optional[str] = None,
+        webhook_secret: Optional[str] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
     ):
         """
         Initialize the scraper with API credentials and configuration.
 
-        :param apify_token: Your Apify API token.
-        :param actor_task_id: The ID of your Apify actor/task.
+        :param apify_token: Your Apify API token. If None, will use the APIFY_TOKEN environment variable.
+        :param actor_task_id: The ID of your Apify actor/task. If None, will use APIFY_TASK_ID.
         :param webhook_url: Optional n8n webhook to trigger instead of direct API.
-        :param poll_interval: Seconds between status checks.
+        :param poll_interval: Seconds before the first status re-check; later checks back off exponentially.
         :param timeout: Max seconds to wait for job completion.
+        :param max_poll_interval: Upper bound on the seconds between status checks.
+        :param callback_url: Optional public URL Apify calls when a run finishes
+            (see notify); when set, get_result waits for it instead of polling.
+            If None, will use APIFY_CALLBACK_URL.
+        :param webhook_secret: Shared secret Apify echoes on callback requests
+            (see verify_callback); required with callback_url. If None, will use
+            APIFY_WEBHOOK_SECRET.
+        :param clock: Monotonic time source in seconds used for timeouts.
+        :param sleep: Coroutine function used to wait between status checks and retries.
+
+        Raises:
+            ValueError: If Apify credentials are missing or callback_url has no webhook_secret.
         """
-        self.apify_token = apify_token
-        self.actor_task_id = actor_task_id
+        self.apify_token = apify_token or os.environ.get("APIFY_TOKEN")
+        self.actor_task_id = actor_task_id or os.environ.get("APIFY_TASK_ID")
         self.webhook_url = webhook_url
         self._poll_interval = poll_interval
+        self._max_poll_interval = max_poll_interval
         self._timeout = timeout
-
-        # Initialize both clients for flexibility
-        self._http_client = httpx.Client(timeout=10)
-        self._apify_client = ApifyClient(token=apify_token)
-
-    def start_scrape(self, config: ScrapeConfig) -> str:
+        self.callback_url = callback_url or os.environ.get("APIFY_CALLBACK_URL")
+        self.webhook_secret = webhook_secret or os.environ.get("APIFY_WEBHOOK_SECRET")
+        self._clock = clock
+        self._sleep = sleep
+
+        if not self.webhook_url and not (self.apify_token and self.actor_task_id):
+            raise ValueError("An Apify token and actor task ID are required without a webhook_url")
+        if self.callback_url and not self.webhook_secret:
+            raise ValueError("A webhook_secret is required to accept callbacks at callback_url")
+
+        # Run id -> event set by notify, and the webhook payload it delivered
+        self._run_finished: Dict[str, asyncio.Event] = {}
+        self._run_payloads: Dict[str, Dict[str, Any]] = {}
+
+        # One async HTTP client serves both the webhook and the Apify REST API, so
+        # many jobs can be started and polled concurrently on one event loop. It is
+        # long-lived and keeps connections to the Apify API warm between polls,
+        # so status checks skip repeated TCP/TLS handshakes.
+        self._http_client = httpx.AsyncClient(
+            base_url=APIFY_API_URL,
+            timeout=10,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=120),
+        )
+        # Sent only on Apify API requests, never to the webhook host
+        self._apify_headers = {"Authorization": f"Bearer {self.apify_token}"}
+        self._apify_json_headers = {**self._apify_headers, **_JSON_HEADERS}
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connections."""
+        await self._http_client.aclose()
+
+    async def start_scrape(self, config: ScrapeConfig) -> str:
         """
         Trigger a scrape job and return a job_id/runId.
 
@@ -68,32 +238,196 @@ class Scraper:
         :return: Job ID string for tracking the scrape job
 
         - If webhook_url is set: POST to webhook with config.json(by_alias=True).
-        - Otherwise: Uses Apify client to start an Actor/Task run.
+        - Otherwise: Starts an Apify task run through the REST API.
         """
-        config_json = config.model_dump(by_alias=True)
+        # Serialize once with orjson instead of letting httpx re-encode with json
+        body = orjson.dumps(config.model_dump(mode="json", by_alias=True))
 
         try:
             if self.webhook_url:
                 # Use webhook URL if provided (keep existing functionality)
-                response = self._http_client.post(self.webhook_url, json=config_json)
-                response.raise_for_status()
+                response = await self._send(
+                    lambda: self._http_client.post(
+                        self.webhook_url, content=body, headers=_JSON_HEADERS
+                    )
+                )
                 data = response.json()
                 return data.get("job_id")
             else:
-                # Use Apify client to start the task
-                task_client = self._apify_client.task(self.actor_task_id)
-                run = task_client.call(run_input=config_json)
+                # Start the task run without waiting; with a callback_url, Apify
+                # calls it when the run finishes
+                params = (
+                    {"webhooks": _encode_webhooks(self.callback_url, self.webhook_secret)}
+                    if self.callback_url else None
+                )
+                response = await self._send(lambda: self._http_client.post(
+                    f"{self._task_path()}/runs",
+                    content=body,
+                    params=params,
+                    headers=self._apify_json_headers
+                ))
+                run = response.json().get("data")
 
                 if not run:
                     raise ApifyClientError("Failed to start task, no run data returned")
 
+                if self.callback_url:
+                    # Register before returning so an early callback is not lost
+                    self._run_finished.setdefault(run.get("id"), asyncio.Event())
                 return run.get("id")
         except httpx.HTTPError as e:
             raise RequestError(f"Failed to start scrape job: {str(e)}") from e
         except Exception as e:
             raise ApifyClientError(f"Failed to start scrape job: {str(e)}") from e
 
-    def get_result(self, job_id: str) -> List[VideoData]:
+    def verify_callback(self, secret: Optional[str]) -> bool:
+        """
+        Check the secret a callback request carried in WEBHOOK_SECRET_HEADER.
+
+        :param secret: Header value, or None if the header was missing
+        :return: True if it matches webhook_secret
+        """
+        if not self.webhook_secret or secret is None:
+            return False
+        return hmac.compare_digest(secret.encode(), self.webhook_secret.encode())
+
+    def notify(self, job_id: str, payload: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Record that a run finished; called from the Apify webhook handler.
+
+        Only runs this scraper is waiting on are recorded, so callbacks for
+        unknown or already timed-out runs cannot accumulate.
+
+        :param job_id: Run ID the webhook refers to
+        :param payload: Webhook body; its "resource" holds the finished run object
+        :return: True if a waiting run was notified, False if the run ID was ignored
+        """
+        event = self._run_finished.get(job_id)
+        if event is None:
+            return False
+        self._run_payloads[job_id] = payload or {}
+        event.set()
+        return True
+
+    async def _wait_for_run(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Wait for a run to finish and return its run object.
+
+        With a callback_url, waits for notify and uses the run from the webhook
+        payload, so the common path makes no status requests. Falls back to
+        polling Apify if the webhook never arrives or carries no run.
+
+        :param job_id: Run ID returned from start_scrape
+        :return: Run object, or None if Apify returned nothing
+
+        Raises:
+            TimeoutError: If the run is not finished within self._timeout
+        """
+        if not self.callback_url:
+            return await self._poll_run(job_id, self._timeout)
+
+        event = self._run_finished.setdefault(job_id, asyncio.Event())
+        try:
+            await asyncio.wait_for(event.wait(), timeout=self._timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            self._run_finished.pop(job_id, None)
+
+        run = self._run_payloads.pop(job_id, {}).get("resource")
+        if run and run.get("status") in _TERMINAL_RUN_STATUSES:
+            return run
+
+        # Safety net: the webhook was lost or incomplete, so ask Apify directly
+        return await self._poll_run(job_id, self._poll_interval)
+
+    async def _poll_run(self, job_id: str, timeout: float) -> Optional[Dict[str, Any]]:
+        """
+        Poll a run until it finishes, letting Apify hold each request open.
+
+        :param job_id: Run ID to wait for
+        :param timeout: Max seconds to wait
+        :return: Finished run object, or None if Apify returned nothing
+
+        Raises:
+            TimeoutError: If the run is not finished within timeout
+        """
+        deadline = self._clock() + timeout
+        while True:
+            remaining = deadline - self._clock()
+            wait_secs = max(1, min(MAX_WAIT_FOR_FINISH_SECS, math.ceil(remaining)))
+            run = await self._get_run(job_id, wait_secs)
+            if not run or run.get("status") in _TERMINAL_RUN_STATUSES:
+                return run
+            if self._clock() >= deadline:
+                raise TimeoutError(f"Scrape job {job_id} did not complete within {timeout} seconds")
+
+    async def _get_run(self, job_id: str, wait_secs: int = 0) -> Dict[str, Any]:
+        """
+        Fetch a run object from the Apify API.
+
+        :param job_id: Run ID to fetch
+        :param wait_secs: Seconds Apify may hold the request waiting for the run to finish
+        :return: Run object, or {} if Apify returned none
+        """
+        params = {"waitForFinish": wait_secs} if wait_secs else None
+        response = await self._send(lambda: self._http_client.get(
+            f"/v2/actor-runs/{job_id}", params=params, headers=self._apify_headers
+        ))
+        return response.json().get("data") or {}
+
+    def _task_path(self) -> str:
+        """API path of the actor task; Apify expects "user~task" where the console shows "user/task"."""
+        return f"/v2/actor-tasks/{self.actor_task_id.replace('/', '~')}"
+
+    async def scrape(self, config: ScrapeConfig) -> List[VideoData]:
+        """
+        Run one scrape job and return its results.
+
+        Jobs that fit within Apify's synchronous run limit use the run-sync
+        endpoint, which starts the run, waits for it and returns its dataset in
+        a single request. If Apify answers 408 because the run outlasted its
+        synchronous wait, the job is started and awaited as a regular run.
+        Webhook, callback and long-running jobs are started and awaited as usual.
+
+        :param config: ScrapeConfig containing scraping parameters
+        :return: List of VideoData objects containing scrape results
+
+        Raises:
+            TimeoutError: if not completed within self._timeout.
+            RequestError: on HTTP failures.
+            ValidationError: if returned data doesn't match VideoData schema.
+        """
+        if self.webhook_url or self.callback_url or self._timeout > SYNC_RUN_MAX_SECS:
+            return await self.get_result(await self.start_scrape(config))
+
+        # Not retried: each attempt would start another run
+        params = {"format": "jsonl", "clean": 1, "timeout": self._timeout}
+        try:
+            async with self._http_client.stream(
+                "POST",
+                f"{self._task_path()}/run-sync-get-dataset-items",
+                content=orjson.dumps(config.model_dump(mode="json", by_alias=True)),
+                params=params,
+                headers=self._apify_json_headers,
+                timeout=self._timeout + SYNC_RUN_TIMEOUT_MARGIN
+            ) as response:
+                sync_timed_out = response.status_code == 408
+                if not sync_timed_out:
+                    response.raise_for_status()
+                    items = [orjson.loads(line) async for line in response.aiter_lines() if line]
+        except httpx.TimeoutException as e:
+            raise TimeoutError(f"Scrape run did not complete within {self._timeout} seconds") from e
+        except httpx.HTTPError as e:
+            raise RequestError(f"Failed to run scrape job: {str(e)}") from e
+
+        if sync_timed_out:
+            # Apify stopped waiting synchronously; fall back to starting the run and awaiting it
+            return await self.get_result(await self.start_scrape(config))
+
+        return self._parse_result({"items": items})
+
+    async def get_result(self, job_id: str) -> List[VideoData]:
         """
         Wait for the job to complete and retrieve results.
 
@@ -106,32 +440,29 @@ class Scraper:
             ApifyClientError: on Apify client failures.
             ValidationError: if returned data doesn't match VideoData schema.
         """
-        start_time = time.time()
+        start_time = self._clock()
 
         if self.webhook_url:
-            # Use existing webhook polling logic
-            while (time.time() - start_time) < self._timeout:
-                try:
-                    status_data = self._check_status(job_id)
-                    status = status_data.get("status")
-
-                    if status == "completed":
-                        return self._parse_result(status_data)
-
-                    # Wait before checking again
-                    time.sleep(self._poll_interval)
-                except httpx.HTTPError as e:
-                    # Retry on HTTP errors
-                    time.sleep(self._poll_interval)
-                    continue
+            # Use existing webhook polling logic, backing off between checks
+            attempt = 0
+            while (self._clock() - start_time) < self._timeout:
+                # Transient HTTP errors are retried inside _check_status; anything
+                # left after the bounded retries surfaces as RequestError
+                status_data = await self._check_status(job_id)
+                status = status_data.get("status")
+
+                if status == "completed":
+                    return self._parse_result(status_data)
+
+                # Wait before checking again, yielding the loop to other jobs
+                remaining = self._timeout - (self._clock() - start_time)
+                await self._sleep(max(0.0, min(self._backoff_delay(attempt), remaining)))
+                attempt += 1
         else:
-            # Use Apify client
+            # Use the Apify API
             try:
-                # Get the run client
-                run_client = self._apify_client.run(job_id)
-
                 # Wait for the run to finish with timeout
-                run = run_client.wait_for_finish(wait_secs=self._timeout)
+                run = await self._wait_for_run(job_id)
 
                 if not run:
                     raise ApifyClientError(f"Failed to get run data for job {job_id}")
@@ -142,8 +473,7 @@ class Scraper:
                     if not dataset_id:
                         raise ApifyClientError("No default dataset found in the run")
 
-                    dataset_client = self._apify_client.dataset(dataset_id)
-                    dataset_items = dataset_client.list_items().get("items", [])
+                    dataset_items = await self._fetch_dataset_items(dataset_id)
 
                     return self._parse_result({"items": dataset_items})
                 else:
@@ -160,7 +490,97 @@ class Scraper:
         # If we get here, we've timed out
         raise TimeoutError(f"Scrape job {job_id} did not complete within {self._timeout} seconds")
 
-    def _check_status(self, job_id: str) -> Dict[str, Any]:
+    def _backoff_delay(self, attempt: int) -> float:
+        """
+        Seconds to wait before the next status check.
+
+        Doubles from poll_interval on every attempt up to max_poll_interval, with
+        jitter over the upper half so concurrent jobs don't poll in lockstep.
+
+        :param attempt: Number of status checks already made, starting at 0
+        :return: Delay in seconds
+        """
+        delay = min(self._max_poll_interval, self._poll_interval * 2 ** attempt)
+        return random.uniform(delay / 2, delay)
+
+    async def _send(self, request: Callable[[], Awaitable[httpx.Response]]) -> httpx.Response:
+        """
+        Send a request, retrying transient failures under the bounded retry policy.
+
+        :param request: Zero-argument coroutine function issuing the request
+        :return: Successful response
+
+        Raises:
+            httpx.HTTPError: If the request still fails after the last attempt
+        """
+        async for attempt in _retrying(self._sleep):
+            with attempt:
+                response = await request()
+                response.raise_for_status()
+        return response
+
+    async def _fetch_dataset_items(self, dataset_id: str) -> List[Dict[str, Any]]:
+        """
+        Download every item of an Apify dataset.
+
+        Reads the total item count with an empty page, then fetches all pages
+        of DATASET_PAGE_SIZE items concurrently. If Apify omits the count, pages
+        are fetched one after another until one comes back short. Pages are
+        streamed as JSON lines and parsed one item at a time, so no page is
+        buffered as a whole.
+
+        :param dataset_id: ID of the run's dataset
+        :return: Dataset items in dataset order
+
+        Raises:
+            httpx.HTTPError: On HTTP request failures
+        """
+        url = f"/v2/datasets/{dataset_id}/items"
+
+        async def fetch_page(offset: int) -> List[Dict[str, Any]]:
+            params = {"limit": DATASET_PAGE_SIZE, "offset": offset, "clean": 1, "format": "jsonl"}
+            async for attempt in _retrying(self._sleep):
+                with attempt:
+                    async with self._http_client.stream("GET", url, params=params, headers=self._apify_headers) as page:
+                        page.raise_for_status()
+                        return [orjson.loads(line) async for line in page.aiter_lines() if line]
+
+        response = await self._send(lambda: self._http_client.get(
+            url, params={"limit": 0, "clean": 1}, headers=self._apify_headers
+        ))
+        total_header = response.headers.get("X-Apify-Pagination-Total")
+
+        if total_header is None:
+            # Without a count the number of pages is unknown, so read them in order
+            items = []
+            offset = 0
+            while True:
+                page = await fetch_page(offset)
+                items.extend(page)
+                if len(page) < DATASET_PAGE_SIZE:
+                    return items
+                offset += DATASET_PAGE_SIZE
+
+        total = int(total_header)
+        pages = await asyncio.gather(*(
+            fetch_page(offset) for offset in range(0, total, DATASET_PAGE_SIZE)
+        ))
+        return [item for page in pages for item in page]
+
+    async def scrape_many(self, configs: List[ScrapeConfig]) -> List[List[VideoData]]:
+        """
+        Run several scrape jobs concurrently.
+
+        All jobs are started together and then awaited together, so the total
+        wait is roughly that of the slowest job rather than the sum of all jobs.
+
+        :param configs: One ScrapeConfig per job
+        :return: One list of VideoData per config, in input order
+        """
+        job_ids = await asyncio.gather(*(self.start_scrape(config) for config in configs))
+        return list(await asyncio.gather(*(self.get_result(job_id) for job_id in job_ids)))
+
+    async def _check_status(self, job_id: str) -> Dict[str, Any]:
         """
         Helper to fetch job status JSON from webhook or Apify API.
 
@@ -175,13 +595,11 @@ class Scraper:
             if self.webhook_url:
                 # Check status via webhook (keep existing functionality)
                 status_url = f"{self.webhook_url}/status/{job_id}"
-                response = self._http_client.get(status_url)
-                response.raise_for_status()
+                response = await self._send(lambda: self._http_client.get(status_url))
                 return response.json()
             else:
-                # Use Apify client to check run status
-                run_client = self._apify_client.run(job_id)
-                run_info = run_client.get()
+                # Check run status via the Apify API
+                run_info = await self._get_run(job_id)
 
                 if not run_info:
                     raise ApifyClientError(f"Failed to get status for job {job_id}")
@@ -202,10 +620,4 @@ class Scraper:
         Raises:
             ValidationError: If data doesn't match expected schema
         """
-        try:
-            items = raw_data.get("items", [])
-            return [VideoData(**item) for item in items]
-        except (KeyError, TypeError) as e:
-            raise ValidationError(f"Invalid data structure: {e}") from e
-        except Exception as e:
-            raise ValidationError(f"Failed to parse result: {e}") from e
+        return _VIDEO_LIST_ADAPTER.validate_python(raw_data.get("items", []))
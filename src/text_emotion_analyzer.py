@@ -1,27 +1,92 @@
-from typing import List, Dict, Optional
+from typing import AsyncContextManager, Dict, List, Mapping, Optional
+from types import MappingProxyType
+from contextlib import nullcontext
+import asyncio
 import os
-import json
-from openai import OpenAI
+import numpy as np
+import orjson
+from src.openai_client import get_async_client
+from src.cache import LRUCache, content_hash
+
+# Scores returned in dummy mode; read-only so one shared instance can be returned
+_DUMMY_RESULT: Mapping[str, float] = MappingProxyType({
+    "joy": 0.8,
+    "sadness": 0.1,
+    "anger": 0.05,
+    "fear": 0.03,
+    "surprise": 0.02
+})
+
+# Fixed order of the scores returned by analyze_vector
+EMOTION_LABELS = ("joy", "sadness", "anger", "fear", "surprise", "disgust", "neutral")
+
+# Structured-output schema: the model must return exactly one number per emotion
+_EMOTION_SCORES_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "emotion_scores",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {label: {"type": "number"} for label in EMOTION_LABELS},
+            "required": list(EMOTION_LABELS),
+            "additionalProperties": False
+        }
+    }
+}
+
+# System prompt for emotion analysis
+_SYSTEM_PROMPT = """
+You are an expert in emotion analysis. Analyze the following text and determine the emotional content.
+Return a JSON object with the following emotions and their corresponding confidence scores (0.0-1.0):
+- joy
+- sadness
+- anger
+- fear
+- surprise
+- disgust
+- neutral
+
+The scores should sum to 1.0.
+Only return the JSON object, nothing else.
+"""
+
+# Scores returned when the model refuses to answer; read-only and shared like _DUMMY_RESULT
+_NEUTRAL_RESULT: Mapping[str, float] = MappingProxyType(
+    {label: 1.0 if label == "neutral" else 0.0 for label in EMOTION_LABELS}
+)
 
 class TextEmotionAnalyzer:
-    def __init__(self, api_key: Optional[str] = None, model_name: str = "gpt-3.5-turbo"):
+    # Seconds a cached analysis stays valid
+    CACHE_TTL_SEC = 3600
+
+    # Maximum number of analyze requests analyze_many keeps in flight
+    MAX_CONCURRENCY = 8
+
+    def __init__(self, api_key: Optional[str] = None, model_name: str = "gpt-4o-mini"):
         """
         Initialize text emotion analyzer using OpenAI API.
 
         Args:
             api_key: OpenAI API key. If None, will use environment variable.
-            model_name: OpenAI model to use for emotion analysis.
+            model_name: OpenAI model to use for emotion analysis; must support structured outputs.
         """
         self.api_key = api_key or os.environ.get("OPENAI_API_KEY")
         self.model_name = model_name
 
-        # Configure OpenAI client
+        # Configure the shared async OpenAI client
         if self.api_key != "dummy":
-            self.client = OpenAI(api_key=self.api_key)
+            self.client = get_async_client(self.api_key)
         else:
             self.client = None
 
-    def analyze(self, texts: List[str]) -> Dict[str, float]:
+        # Cache of analyses keyed by the exact prompt text sent to the model
+        self._emotion_cache = LRUCache(maxsize=1024, ttl=self.CACHE_TTL_SEC)
+
+        # In-flight API requests keyed like the cache, so concurrent identical calls share one
+        self._pending: Dict[str, asyncio.Future] = {}
+
+    async def analyze(self, texts: List[str]) -> Mapping[str, float]:
         """
         Given a list of strings (transcript or comments), returns a mapping
         from emotion label → confidence score (0.0-1.0).
@@ -30,63 +95,124 @@ class TextEmotionAnalyzer:
             texts: List of text strings to analyze
 
         Returns:
-            Dictionary mapping emotion labels to confidence scores
+            Mapping of emotion labels to confidence scores (read-only in dummy mode)
+        """
+        return await self._analyze(texts, nullcontext())
+
+    async def _analyze(self, texts: List[str], limiter: AsyncContextManager) -> Mapping[str, float]:
+        """
+        Analyze texts, entering limiter only around the API call.
+
+        Cache hits and requests joining one already in flight never wait on the limiter.
+
+        Args:
+            texts: List of text strings to analyze
+            limiter: Async context manager bounding concurrent API calls (e.g. a semaphore)
+
+        Returns:
+            Mapping of emotion labels to confidence scores (read-only in dummy mode)
         """
         # Return dummy data for testing
         if self.api_key == "dummy":
-            return {
-                "joy": 0.8,
-                "sadness": 0.1,
-                "anger": 0.05,
-                "fear": 0.03,
-                "surprise": 0.02
-            }
+            return _DUMMY_RESULT
 
         # Combine texts into a single analysis request
         combined_text = "\n".join(texts)
 
-        # Create prompt for emotion analysis
-        system_prompt = """
-        You are an expert in emotion analysis. Analyze the following text and determine the emotional content.
-        Return a JSON object with the following emotions and their corresponding confidence scores (0.0-1.0):
-        - joy
-        - sadness
-        - anger
-        - fear
-        - surprise
-        - disgust
-        - neutral
-
-        The scores should sum to 1.0.
-        Only return the JSON object, nothing else.
+        # Serve repeated inputs from the cache
+        cache_key = content_hash(self.model_name, combined_text)
+        cached = self._emotion_cache.get(cache_key)
+        if cached is not None:
+            return dict(cached)
+
+        # Identical requests already in flight share one API call; shield it so a
+        # cancelled caller does not cancel the request for the others
+        request = self._pending.get(cache_key)
+        if request is None:
+            request = self._pending[cache_key] = asyncio.ensure_future(
+                self._request_scores(combined_text, cache_key, limiter)
+            )
+        return dict(await asyncio.shield(request))
+
+    async def _request_scores(
+        self,
+        combined_text: str,
+        cache_key: str,
+        limiter: AsyncContextManager
+    ) -> Mapping[str, float]:
         """
+        Score one combined text with the model and cache the result.
 
-        # Make API call
-        response = self.client.chat.completions.create(
-            model=self.model_name,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": combined_text}
-            ],
-            temperature=0.0,
-            response_format={"type": "json_object"}
-        )
+        Args:
+            combined_text: Texts to analyze, joined into one prompt
+            cache_key: Key of the analysis in the cache and in the pending requests
+            limiter: Held for the duration of the API call
 
-        # Extract and parse JSON from response
+        Returns:
+            Mapping of emotion labels to confidence scores (read-only on a refusal)
+        """
         try:
-            result = json.loads(response.choices[0].message.content)
-            # Ensure all values are floats
-            for key in result:
-                result[key] = float(result[key])
+            # Make API call
+            async with limiter:
+                response = await self.client.chat.completions.create(
+                    model=self.model_name,
+                    messages=[
+                        {"role": "system", "content": _SYSTEM_PROMPT},
+                        {"role": "user", "content": combined_text}
+                    ],
+                    temperature=0.0,
+                    response_format=_EMOTION_SCORES_FORMAT
+                )
+
+            # Structured outputs guarantee schema-conforming JSON; only a refusal has no content
+            content = response.choices[0].message.content
+            if content is None:
+                return _NEUTRAL_RESULT
+
+            # Ensure all values are floats (orjson keeps integral scores such as 1 as int)
+            result = {key: float(value) for key, value in orjson.loads(content).items()}
+            self._emotion_cache.set(cache_key, dict(result))
             return result
-        except (json.JSONDecodeError, AttributeError, IndexError) as e:
-            # Fallback in case of parsing errors
-            return {
-                "joy": 0.0,
-                "sadness": 0.0,
-                "anger": 0.0,
-                "fear": 0.0,
-                "surprise": 0.0,
-                "disgust": 0.0,
-                "neutral": 1.0
-            }
+        finally:
+            # Later identical calls go to the cache (or start a fresh request on failure)
+            self._pending.pop(cache_key, None)
+
+    async def analyze_vector(self, texts: List[str]) -> np.ndarray:
+        """
+        Like analyze, but return the scores as a fixed-layout float32 vector.
+
+        Vectors from many calls can be stacked into one matrix for vectorized
+        scoring downstream.
+
+        Args:
+            texts: List of text strings to analyze
+
+        Returns:
+            Array of shape (len(EMOTION_LABELS),) in EMOTION_LABELS order; missing emotions are 0
+        """
+        scores = await self.analyze(texts)
+        return np.fromiter(
+            (scores.get(label, 0.0) for label in EMOTION_LABELS),
+            dtype=np.float32,
+            count=len(EMOTION_LABELS)
+        )
+
+    async def analyze_many(
+        self,
+        text_lists: List[List[str]],
+        concurrency: Optional[int] = None
+    ) -> List[Mapping[str, float]]:
+        """
+        Analyze several groups of texts (e.g. the comments of each video) concurrently.
+
+        Cached groups are answered immediately; only API calls count against concurrency.
+
+        Args:
+            text_lists: One list of text strings per group
+            concurrency: Maximum API requests in flight, or None for MAX_CONCURRENCY
+
+        Returns:
+            One mapping of emotion scores per group, in input order
+        """
+        semaphore = asyncio.Semaphore(concurrency or self.MAX_CONCURRENCY)
+        return list(await asyncio.gather(*(self._analyze(texts, semaphore) for texts in text_lists)))
@@ -1,38 +1,52 @@
-from typing import List, Dict, Optional
-import re
+from typing import ClassVar, Iterable, Mapping, Optional, Tuple
+from types import MappingProxyType
+import string
+
+# TikTok video URLs: www.tiktok.com or vm.tiktok.com followed by a path
+_TIKTOK_HOST_SEPARATOR = ".tiktok.com/"
+_TIKTOK_PREFIXES = (
+    "https://www.tiktok.com/",
+    "http://www.tiktok.com/",
+    "https://vm.tiktok.com/",
+    "http://vm.tiktok.com/",
+)
+
+# Longest URL accepted; longer input is rejected before its path is scanned
+MAX_URL_LENGTH = 2048
+
+# Characters allowed in the path after the prefix
+_ALLOWED_PATH_CHARS = frozenset(string.ascii_letters + string.digits + "@_-./")
 
 
 class VideoFinder:
-    def __init__(self):
-        """
-        Initialize with a mapping from topic → List[str] of 10 URLs.
-        """
-        self._video_mapping: Dict[str, List[str]] = {
-            "cooking": [
-                "https://www.tiktok.com/cooking/video1",
-                "https://www.tiktok.com/cooking/video2",
-                "https://www.tiktok.com/cooking/video3",
-                "https://www.tiktok.com/cooking/video4",
-                "https://www.tiktok.com/cooking/video5",
-                "https://www.tiktok.com/cooking/video6",
-                "https://www.tiktok.com/cooking/video7",
-                "https://www.tiktok.com/cooking/video8",
-                "https://www.tiktok.com/cooking/video9",
-                "https://www.tiktok.com/cooking/video10",
-            ],
-            "fitness": [
-                "https://www.tiktok.com/fitness/video1",
-                "https://www.tiktok.com/fitness/video2",
-                "https://www.tiktok.com/fitness/video3",
-                "https://www.tiktok.com/fitness/video4",
-                "https://www.tiktok.com/fitness/video5",
-                "https://www.tiktok.com/fitness/video6",
-                "https://www.tiktok.com/fitness/video7",
-                "https://www.tiktok.com/fitness/video8",
-                "https://www.tiktok.com/fitness/video9",
-                "https://www.tiktok.com/fitness/video10",
-            ]
-        }
+    # Topic → tuple of 10 URLs, built once at class creation. Tuples and the
+    # read-only mapping are immutable, so get_videos hands them out without copying.
+    _VIDEO_MAPPING: ClassVar[Mapping[str, Tuple[str, ...]]] = MappingProxyType({
+        "cooking": (
+            "https://www.tiktok.com/cooking/video1",
+            "https://www.tiktok.com/cooking/video2",
+            "https://www.tiktok.com/cooking/video3",
+            "https://www.tiktok.com/cooking/video4",
+            "https://www.tiktok.com/cooking/video5",
+            "https://www.tiktok.com/cooking/video6",
+            "https://www.tiktok.com/cooking/video7",
+            "https://www.tiktok.com/cooking/video8",
+            "https://www.tiktok.com/cooking/video9",
+            "https://www.tiktok.com/cooking/video10",
+        ),
+        "fitness": (
+            "https://www.tiktok.com/fitness/video1",
+            "https://www.tiktok.com/fitness/video2",
+            "https://www.tiktok.com/fitness/video3",
+            "https://www.tiktok.com/fitness/video4",
+            "https://www.tiktok.com/fitness/video5",
+            "https://www.tiktok.com/fitness/video6",
+            "https://www.tiktok.com/fitness/video7",
+            "https://www.tiktok.com/fitness/video8",
+            "https://www.tiktok.com/fitness/video9",
+            "https://www.tiktok.com/fitness/video10",
+        )
+    })
 
     def is_valid_tiktok_url(self, url: str) -> bool:
         """
@@ -44,25 +58,40 @@ class VideoFinder:
         Returns:
             bool: True if valid TikTok URL, False otherwise
         """
-        # Pattern for TikTok URLs (www.tiktok.com or vm.tiktok.com followed by path)
-        pattern = r'^https?://(www|vm)\.tiktok\.com/[@a-zA-Z0-9_\-./]+$'
-        return bool(re.match(pattern, url))
+        if len(url) > MAX_URL_LENGTH or not url.startswith(_TIKTOK_PREFIXES):
+            return False
+
+        # Every prefix ends in the host, so the path starts after its first occurrence
+        path = url.partition(_TIKTOK_HOST_SEPARATOR)[2]
+        return bool(path) and _ALLOWED_PATH_CHARS.issuperset(path)
+
+    def classify_urls(self, urls: Iterable[str]) -> Tuple[str, ...]:
+        """
+        Validate many URLs at once, keeping only proper TikTok video URLs.
+
+        Args:
+            urls: URL strings to validate
+
+        Returns:
+            The valid URLs, in input order
+        """
+        return tuple(filter(self.is_valid_tiktok_url, urls))
 
-    def get_videos(self, topic: str, direct_url: Optional[str] = None) -> List[str]:
+    def get_videos(self, topic: str, direct_url: Optional[str] = None) -> Tuple[str, ...]:
         """
-        Given a topic, return exactly 10 hardcoded TikTok URLs or [] if unknown.
-        If a direct URL is provided, validate and return it as a single-item list.
+        Given a topic, return exactly 10 hardcoded TikTok URLs or () if unknown.
+        If a direct URL is provided, validate and return it as a single-item tuple.
 
         Args:
             topic: A string representing the topic of interest
             direct_url: Optional direct TikTok URL to process
 
         Returns:
-            A list of TikTok video URLs
+            An immutable tuple of TikTok video URLs, shared between calls
         """
         if direct_url:
             if self.is_valid_tiktok_url(direct_url):
-                return [direct_url]
-            return []
+                return (direct_url,)
+            return ()
 
-        return self._video_mapping.get(topic, [])
+        return self._VIDEO_MAPPING.get(topic, ())
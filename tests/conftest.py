@@ -0,0 +1,136 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+import pytest
+
+
+@pytest.fixture
+def anyio_backend():
+    """Run async tests on asyncio only."""
+    return "asyncio"
+
+
+# Sample scrape results are validated once per session; tuples keep them from
+# being mutated between tests, so tests that need to change one should copy it.
+# Application modules are imported inside fixtures so that running a single
+# test file does not import the scraper, FastAPI and their dependencies.
+
+@pytest.fixture(scope="session")
+def chat_video_data():
+    """Two scraped videos returned for a topic query."""
+    from src.scraper import VideoData
+
+    return (
+        VideoData(
+            url="https://example.com/video1",
+            title="Test Video 1",
+            transcript="Test transcript 1",
+            audio_features={"pitch": 0.5, "tempo": 0.7},
+            metadata={"likes": 100, "views": 1000},
+            comments=["Great video!", "Nice content"]
+        ),
+        VideoData(
+            url="https://example.com/video2",
+            title="Test Video 2",
+            transcript="Test transcript 2",
+            audio_features={"pitch": 0.6, "tempo": 0.8},
+            metadata={"likes": 200, "views": 2000},
+            comments=["Awesome!", "Very helpful"]
+        ),
+    )
+
+
+@pytest.fixture(scope="session")
+def direct_url_video_data():
+    """A single scraped video returned for a direct TikTok URL."""
+    from src.scraper import VideoData
+
+    return (
+        VideoData(
+            url="https://www.tiktok.com/@username/video/1234567890",
+            title="Direct TikTok Video",
+            transcript="This is a direct TikTok video test",
+            audio_features={"pitch": 0.6, "tempo": 0.7},
+            metadata={"likes": 500, "views": 5000},
+            comments=["Great!", "Love it"]
+        ),
+    )
+
+
+@pytest.fixture(scope="session")
+def correlator_video_data():
+    """Two scraped videos with every metadata field set."""
+    from src.scraper import VideoData
+
+    return (
+        VideoData(
+            url="https://example.com/video1",
+            comments=["Great video!", "Love it!"],
+            metadata={"likes": 100, "comments": 2, "shares": 50, "views": 1000}
+        ),
+        VideoData(
+            url="https://example.com/video2",
+            comments=["Nice content", "Could be better"],
+            metadata={"likes": 80, "comments": 2, "shares": 30, "views": 800}
+        ),
+    )
+
+
+@pytest.fixture(scope="session")
+def client():
+    """One TestClient for the whole session, so app startup/shutdown runs once."""
+    from fastapi.testclient import TestClient
+    from src.app import app
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def openai_response():
+    """Build a plain stand-in for an OpenAI chat completion with the given message content."""
+    def build(content):
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+    return build
+
+
+@pytest.fixture
+def app_components(monkeypatch):
+    """
+    Give src.app an empty component registry for this test.
+
+    Components are keyed by their factory, and tests patch in a new factory
+    each time, so a shared registry would keep every test's mocks alive.
+    """
+    components = {}
+    monkeypatch.setattr("src.app._components", components)
+    return components
+
+
+@pytest.fixture
+def mock_components(monkeypatch, app_components):
+    """
+    Install a spec'd mock for every pipeline component used by src.app.
+
+    Mocks are built fresh per test: copies of a cached prototype would share
+    their child mocks, so return values set in one test would leak into the next.
+    Async methods are mocked as AsyncMock automatically through the spec.
+    """
+    from src.app import (
+        AudioEmotionAnalyzer, Correlator, InsightGenerator, Scraper, TextEmotionAnalyzer, VideoFinder
+    )
+
+    components = SimpleNamespace(
+        video_finder=MagicMock(spec=VideoFinder),
+        scraper=MagicMock(spec=Scraper),
+        text_analyzer=MagicMock(spec=TextEmotionAnalyzer),
+        audio_analyzer=MagicMock(spec=AudioEmotionAnalyzer),
+        correlator=MagicMock(spec=Correlator),
+        insight_generator=MagicMock(spec=InsightGenerator),
+    )
+    monkeypatch.setattr("src.app.VideoFinder", lambda: components.video_finder)
+    monkeypatch.setattr("src.app.Scraper", lambda: components.scraper)
+    monkeypatch.setattr("src.app.TextEmotionAnalyzer", lambda: components.text_analyzer)
+    monkeypatch.setattr("src.app.AudioEmotionAnalyzer", lambda: components.audio_analyzer)
+    monkeypatch.setattr("src.app.Correlator", lambda: components.correlator)
+    monkeypatch.setattr("src.app.InsightGenerator", lambda: components.insight_generator)
+    return components
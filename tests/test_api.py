@@ -1,105 +1,42 @@
-from fastapi.testclient import TestClient
+import json
+import numpy as np
 import pytest
-import traceback
-from unittest.mock import MagicMock, patch
-from src.app import app
-from src.scraper import VideoData, ScrapeConfig
-
-client = TestClient(app)
-
-# Debug middleware to capture responses and exceptions
-@app.middleware("http")
-async def debug_errors(request, call_next):
-    try:
-        response = await call_next(request)
-        return response
-    except Exception as exc:
-        print(f"Exception in middleware: {exc}")
-        print(traceback.format_exc())
-        raise
-
-def test_chat_endpoint_success(monkeypatch):
+from unittest.mock import AsyncMock, MagicMock, create_autospec, patch
+from src.insight_generator import InsightGenerator
+from src.scraper import WEBHOOK_SECRET_HEADER, VideoData, ScrapeConfig, metadata_matrix
+
+# Every test patches component factories, so each starts from an empty registry
+pytestmark = pytest.mark.usefixtures("app_components")
+
+@pytest.mark.parametrize("params, video_data_fixture", [
+    ({"query": "cooking", "limit": 2}, "chat_video_data"),
+    (
+        {"query": "any_topic", "limit": 1, "url": "https://www.tiktok.com/@username/video/1234567890"},
+        "direct_url_video_data"
+    ),
+], ids=["topic", "direct_url"])
+def test_chat_endpoint_success(client, mock_components, request, params, video_data_fixture):
     # Mock test data
-    test_videos = ["https://example.com/video1", "https://example.com/video2"]
-    test_video_data = [
-        VideoData(
-            url="https://example.com/video1",
-            title="Test Video 1",
-            transcript="Test transcript 1",
-            audio_features={"pitch": 0.5, "tempo": 0.7},
-            metadata={"likes": 100, "views": 1000},
-            comments=["Great video!", "Nice content"]
-        ),
-        VideoData(
-            url="https://example.com/video2",
-            title="Test Video 2",
-            transcript="Test transcript 2",
-            audio_features={"pitch": 0.6, "tempo": 0.8},
-            metadata={"likes": 200, "views": 2000},
-            comments=["Awesome!", "Very helpful"]
-        )
-    ]
+    test_video_data = request.getfixturevalue(video_data_fixture)
+    test_videos = [video.url for video in test_video_data]
     test_text_emotions = {"joy": 0.5, "sadness": 0.2, "anger": 0.1}
     test_audio_emotions = {"joy": 0.3, "sadness": 0.4, "anger": 0.2}
     test_correlations = {"joy_vs_likes": 1.2, "sadness_vs_views": -0.8}
     test_insights = ["Insight 1", "Insight 2"]
     test_pr_hooks = ["PR Hook 1", "PR Hook 2"]
 
-    # Mock VideoFinder
-    mock_video_finder = MagicMock()
-    mock_video_finder.get_videos.return_value = test_videos
-    monkeypatch.setattr("src.app.VideoFinder", lambda: mock_video_finder)
-
-    # Create a proper scraper mock that validates the config
-    class MockScraper:
-        def start_scrape(self, config):
-            print("Mock scraper start_scrape called")
-            # Verify config has required fields
-            assert isinstance(config, ScrapeConfig)
-            assert config.commentsPerPost == 10
-            assert config.excludePinnedPosts is True
-            assert config.maxRepliesPerComment == 5
-            assert config.resultsPerPage == 20
-            assert config.postURLs == test_videos
-            return "mock_job_id"
-
-        def get_result(self):
-            print("Mock scraper get_result called")
-            return test_video_data
-
-    monkeypatch.setattr("src.app.Scraper", MockScraper)
-
-    # Mock TextEmotionAnalyzer
-    mock_text_analyzer = MagicMock()
-    mock_text_analyzer.analyze.return_value = test_text_emotions
-    monkeypatch.setattr("src.app.TextEmotionAnalyzer", lambda: mock_text_analyzer)
-
-    # Mock AudioEmotionAnalyzer
-    mock_audio_analyzer = MagicMock()
-    mock_audio_analyzer.analyze.return_value = test_audio_emotions
-    monkeypatch.setattr("src.app.AudioEmotionAnalyzer", lambda: mock_audio_analyzer)
-
-    # Mock Correlator
-    mock_correlator = MagicMock()
-    mock_correlator.compute.return_value = test_correlations
-    monkeypatch.setattr("src.app.Correlator", lambda: mock_correlator)
-
-    # Mock InsightGenerator
-    mock_insight_generator = MagicMock()
-    mock_insight_generator.generate.return_value = test_insights
-    mock_insight_generator.suggest_pr_hooks.return_value = test_pr_hooks
-    monkeypatch.setattr("src.app.InsightGenerator", lambda: mock_insight_generator)
+    mock_components.video_finder.get_videos.return_value = test_videos
+    mock_components.scraper.scrape.return_value = test_video_data
+    mock_components.text_analyzer.analyze.return_value = test_text_emotions
+    mock_components.audio_analyzer.analyze.return_value = test_audio_emotions
+    mock_components.correlator.compute.return_value = test_correlations
+    mock_components.insight_generator.generate_with_hooks.return_value = (test_insights, test_pr_hooks)
 
     # Make request
-    response = client.get("/chat", params={"query": "cooking", "limit": 2})
-
-    # Print debug info
-    print(f"Response status: {response.status_code}")
-    if response.status_code != 200:
-        print(f"Response body: {response.json()}")
+    response = client.get("/chat", params=params)
 
     # Assertions
-    assert response.status_code == 200
+    assert response.status_code == 200, response.text
     json_response = response.json()
 
     assert json_response == {
@@ -113,90 +50,25 @@ def test_chat_endpoint_success(monkeypatch):
         "pr_hooks": test_pr_hooks
     }
 
-    # Verify only the VideoFinder was called with expected parameters
-    mock_video_finder.get_videos.assert_called_once_with("cooking", direct_url=None)
-
-def test_chat_endpoint_direct_url(monkeypatch):
-    # Test data for direct URL
-    direct_tiktok_url = "https://www.tiktok.com/@username/video/1234567890"
-    test_videos = [direct_tiktok_url]
-    test_video_data = [
-        VideoData(
-            url=direct_tiktok_url,
-            title="Direct TikTok Video",
-            transcript="This is a direct TikTok video test",
-            audio_features={"pitch": 0.6, "tempo": 0.7},
-            metadata={"likes": 500, "views": 5000},
-            comments=["Great!", "Love it"]
-        )
-    ]
-    test_text_emotions = {"joy": 0.7, "sadness": 0.1}
-    test_audio_emotions = {"joy": 0.6, "sadness": 0.2}
-    test_correlations = {"joy_vs_likes": 0.8}
-    test_insights = ["Direct URL Insight"]
-    test_pr_hooks = ["Direct URL PR Hook"]
+    # Verify the scraper got a complete config
+    config = mock_components.scraper.scrape.await_args.args[0]
+    assert isinstance(config, ScrapeConfig)
+    assert config.commentsPerPost == 10
+    assert config.excludePinnedPosts is True
+    assert config.maxRepliesPerComment == 5
+    assert config.resultsPerPage == 20
+    assert config.postURLs == test_videos
 
-    # Mock VideoFinder
-    mock_video_finder = MagicMock()
-    mock_video_finder.get_videos.return_value = test_videos
-    monkeypatch.setattr("src.app.VideoFinder", lambda: mock_video_finder)
-
-    # Create scraper mock
-    class MockScraper:
-        def start_scrape(self, config):
-            assert isinstance(config, ScrapeConfig)
-            assert config.postURLs == test_videos
-            return "mock_job_id"
-
-        def get_result(self):
-            return test_video_data
-
-    monkeypatch.setattr("src.app.Scraper", MockScraper)
-
-    # Mock other analyzers
-    mock_text_analyzer = MagicMock()
-    mock_text_analyzer.analyze.return_value = test_text_emotions
-    monkeypatch.setattr("src.app.TextEmotionAnalyzer", lambda: mock_text_analyzer)
-
-    mock_audio_analyzer = MagicMock()
-    mock_audio_analyzer.analyze.return_value = test_audio_emotions
-    monkeypatch.setattr("src.app.AudioEmotionAnalyzer", lambda: mock_audio_analyzer)
-
-    mock_correlator = MagicMock()
-    mock_correlator.compute.return_value = test_correlations
-    monkeypatch.setattr("src.app.Correlator", lambda: mock_correlator)
-
-    mock_insight_generator = MagicMock()
-    mock_insight_generator.generate.return_value = test_insights
-    mock_insight_generator.suggest_pr_hooks.return_value = test_pr_hooks
-    monkeypatch.setattr("src.app.InsightGenerator", lambda: mock_insight_generator)
-
-    # Make request with direct URL
-    response = client.get("/chat", params={
-        "query": "any_topic",
-        "limit": 1,
-        "url": direct_tiktok_url
-    })
-
-    # Assertions
-    assert response.status_code == 200
-    json_response = response.json()
-
-    assert json_response == {
-        "videos": test_videos,
-        "emotions": {
-            "text": test_text_emotions,
-            "audio": test_audio_emotions
-        },
-        "correlations": test_correlations,
-        "insights": test_insights,
-        "pr_hooks": test_pr_hooks
-    }
+    # Verify only the VideoFinder was called with expected parameters
+    mock_components.video_finder.get_videos.assert_called_once_with(params["query"], direct_url=params.get("url"))
+    mock_components.insight_generator.generate_with_hooks.assert_awaited_once_with(test_correlations)
 
-    # Verify VideoFinder was called with expected parameters
-    mock_video_finder.get_videos.assert_called_once_with("any_topic", direct_url=direct_tiktok_url)
+    # The correlator gets the scraped metadata as one precomputed array
+    compute_call = mock_components.correlator.compute.call_args
+    assert compute_call.args == (test_video_data, test_text_emotions, test_audio_emotions)
+    np.testing.assert_array_equal(compute_call.kwargs["metadata_matrix"], metadata_matrix(test_video_data))
 
-def test_chat_endpoint_invalid_direct_url(monkeypatch):
+def test_chat_endpoint_invalid_direct_url(client, monkeypatch):
     # Mock VideoFinder to validate and reject invalid URL
     mock_video_finder = MagicMock()
     mock_video_finder.get_videos.return_value = []
@@ -212,11 +84,11 @@ def test_chat_endpoint_invalid_direct_url(monkeypatch):
     assert "No videos found" in response.json()["detail"]
     mock_video_finder.get_videos.assert_called_once_with("any_topic", direct_url=invalid_url)
 
-def test_chat_endpoint_missing_query():
+def test_chat_endpoint_missing_query(client):
     response = client.get("/chat")
     assert response.status_code == 422
 
-def test_chat_endpoint_no_videos_found(monkeypatch):
+def test_chat_endpoint_no_videos_found(client, monkeypatch):
     # Mock VideoFinder to return empty list
     mock_video_finder = MagicMock()
     mock_video_finder.get_videos.return_value = []
@@ -226,17 +98,157 @@ def test_chat_endpoint_no_videos_found(monkeypatch):
     assert response.status_code == 404
     assert "No videos found" in response.json()["detail"]
 
-def test_chat_endpoint_scraper_timeout(monkeypatch):
+def test_chat_endpoint_scraper_timeout(client, monkeypatch):
     # Mock VideoFinder
     mock_video_finder = MagicMock()
     mock_video_finder.get_videos.return_value = ["https://example.com/video1"]
     monkeypatch.setattr("src.app.VideoFinder", lambda: mock_video_finder)
 
     # Mock Scraper to raise TimeoutError
-    mock_scraper = MagicMock()
-    mock_scraper.start_scrape.side_effect = TimeoutError("Scraping timeout")
+    mock_scraper = AsyncMock()
+    mock_scraper.scrape.side_effect = TimeoutError("Scraping timeout")
     monkeypatch.setattr("src.app.Scraper", lambda: mock_scraper)
 
     response = client.get("/chat", params={"query": "cooking"})
     assert response.status_code == 504
     assert "timed out" in response.json()["detail"]
+
+def test_chat_stream_emits_stage_events(client, monkeypatch):
+    test_videos = ["https://example.com/video1"]
+    test_video_data = [
+        VideoData(
+            url="https://example.com/video1",
+            metadata={"likes": 100, "views": 1000},
+            comments=["Great video!"]
+        )
+    ]
+
+    mock_video_finder = MagicMock()
+    mock_video_finder.get_videos.return_value = test_videos
+    monkeypatch.setattr("src.app.VideoFinder", lambda: mock_video_finder)
+
+    mock_scraper = AsyncMock()
+    mock_scraper.scrape.return_value = test_video_data
+    monkeypatch.setattr("src.app.Scraper", lambda: mock_scraper)
+
+    mock_text_analyzer = AsyncMock()
+    mock_text_analyzer.analyze.return_value = {"joy": 0.5}
+    monkeypatch.setattr("src.app.TextEmotionAnalyzer", lambda: mock_text_analyzer)
+
+    mock_audio_analyzer = AsyncMock()
+    mock_audio_analyzer.analyze.return_value = {"joy": 0.3}
+    monkeypatch.setattr("src.app.AudioEmotionAnalyzer", lambda: mock_audio_analyzer)
+
+    mock_correlator = MagicMock()
+    mock_correlator.compute.return_value = {"joy_vs_likes": 1.2}
+    monkeypatch.setattr("src.app.Correlator", lambda: mock_correlator)
+
+    # Autospec so a call that does not match InsightGenerator's signatures fails the test
+    mock_insight_generator = create_autospec(InsightGenerator, instance=True)
+    mock_insight_generator.generate.return_value = ["Insight 1"]
+    mock_insight_generator.suggest_pr_hooks.return_value = ["PR Hook 1"]
+    monkeypatch.setattr("src.app.InsightGenerator", lambda: mock_insight_generator)
+
+    response = client.get("/chat/stream", params={"query": "cooking", "limit": 1})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert [event["stage"] for event in events] == [
+        "videos", "emotions", "correlations", "insights", "pr_hooks"
+    ]
+    assert events[0]["data"] == test_videos
+    assert events[1]["data"] == {"text": {"joy": 0.5}, "audio": {"joy": 0.3}}
+    assert events[-1]["data"] == ["PR Hook 1"]
+    mock_insight_generator.generate.assert_awaited_once_with({"joy_vs_likes": 1.2})
+    mock_insight_generator.suggest_pr_hooks.assert_awaited_once_with(["Insight 1"])
+
+def test_chat_stream_serializes_dummy_analyzer_scores(client, mock_components, monkeypatch, chat_video_data):
+    from src.audio_emotion_analyzer import AudioEmotionAnalyzer
+    from src.text_emotion_analyzer import TextEmotionAnalyzer
+
+    # Real dummy-mode analyzers, so the stream has to serialize their actual return values
+    text_analyzer = TextEmotionAnalyzer(api_key="dummy")
+    audio_analyzer = AudioEmotionAnalyzer(api_key="dummy", openai_api_key="dummy")
+    monkeypatch.setattr("src.app.TextEmotionAnalyzer", lambda: text_analyzer)
+    monkeypatch.setattr("src.app.AudioEmotionAnalyzer", lambda: audio_analyzer)
+
+    mock_components.video_finder.get_videos.return_value = [video.url for video in chat_video_data]
+    mock_components.scraper.scrape.return_value = chat_video_data
+    mock_components.correlator.compute.return_value = {"joy_vs_likes": 1.2}
+    mock_components.insight_generator.generate.return_value = ["Insight 1"]
+    mock_components.insight_generator.suggest_pr_hooks.return_value = ["PR Hook 1"]
+
+    response = client.get("/chat/stream", params={"query": "cooking", "limit": 2})
+
+    assert response.status_code == 200
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert [event["stage"] for event in events] == [
+        "videos", "emotions", "correlations", "insights", "pr_hooks"
+    ]
+    assert events[1]["data"]["text"]["joy"] == 0.8
+
+def test_chat_stream_no_videos_found(client, monkeypatch):
+    mock_video_finder = MagicMock()
+    mock_video_finder.get_videos.return_value = []
+    monkeypatch.setattr("src.app.VideoFinder", lambda: mock_video_finder)
+
+    response = client.get("/chat/stream", params={"query": "nonexistent_topic"})
+    assert response.status_code == 404
+    assert "No videos found" in response.json()["detail"]
+
+def test_chat_endpoint_reuses_components(client, monkeypatch):
+    # The VideoFinder factory should only be invoked for the first request
+    mock_video_finder = MagicMock()
+    mock_video_finder.get_videos.return_value = []
+    factory = MagicMock(return_value=mock_video_finder)
+    monkeypatch.setattr("src.app.VideoFinder", factory)
+
+    client.get("/chat", params={"query": "nonexistent_topic"})
+    client.get("/chat", params={"query": "nonexistent_topic"})
+
+    factory.assert_called_once_with()
+    assert mock_video_finder.get_videos.call_count == 2
+
+def test_apify_callback_notifies_scraper(client, mock_components):
+    mock_components.scraper.verify_callback.return_value = True
+    mock_components.scraper.notify.return_value = True
+
+    payload = {
+        "eventType": "ACTOR.RUN.SUCCEEDED",
+        "eventData": {"actorRunId": "run-123"},
+        "resource": {"id": "run-123", "status": "SUCCEEDED", "defaultDatasetId": "dataset-1"}
+    }
+    response = client.post("/apify/callback", json=payload, headers={WEBHOOK_SECRET_HEADER: "s3cret"})
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
+    mock_components.scraper.verify_callback.assert_called_once_with("s3cret")
+    mock_components.scraper.notify.assert_called_once_with("run-123", payload)
+
+def test_apify_callback_without_run_id(client, mock_components):
+    mock_components.scraper.verify_callback.return_value = True
+
+    response = client.post("/apify/callback", json={"eventType": "ACTOR.RUN.SUCCEEDED"})
+    assert response.status_code == 400
+
+def test_apify_callback_rejects_wrong_secret(client, monkeypatch):
+    from src.scraper import Scraper
+
+    scraper = Scraper(
+        apify_token="test_token",
+        actor_task_id="test_task_id",
+        callback_url="https://cooper.example.com/apify/callback",
+        webhook_secret="s3cret",
+    )
+    monkeypatch.setattr("src.app.Scraper", lambda: scraper)
+    payload = {"eventData": {"actorRunId": "run-123"}}
+
+    for headers in ({}, {WEBHOOK_SECRET_HEADER: "guess"}):
+        response = client.post("/apify/callback", json=payload, headers=headers)
+        assert response.status_code == 401
+
+    # A genuine callback for a run nobody is waiting on is dropped, not stored
+    response = client.post("/apify/callback", json=payload, headers={WEBHOOK_SECRET_HEADER: "s3cret"})
+    assert response.json() == {"status": "ignored"}
+    assert scraper._run_payloads == {}
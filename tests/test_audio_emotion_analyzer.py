@@ -1,9 +1,25 @@
 import pytest
 from src.audio_emotion_analyzer import AudioEmotionAnalyzer
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
+import json
 import os
-
-def test_analyze_returns_scores_for_dummy_audio(tmp_path):
+import sys
+from types import SimpleNamespace
+
+# Emotion scores returned by the mocked chat completion
+_MOCK_EMOTIONS = {
+    "joy": 0.7,
+    "sadness": 0.05,
+    "anger": 0.0,
+    "fear": 0.0,
+    "surprise": 0.15,
+    "disgust": 0.0,
+    "neutral": 0.1
+}
+_MOCK_EMOTIONS_JSON = json.dumps(_MOCK_EMOTIONS)
+
+@pytest.mark.anyio
+async def test_analyze_returns_scores_for_dummy_audio(tmp_path):
     # Create dummy WAV file
     audio_file = tmp_path / "dummy.wav"
     audio_file.write_bytes(b"RIFF....WAVEfmt ")
@@ -11,7 +27,7 @@ def test_analyze_returns_scores_for_dummy_audio(tmp_path):
     analyzer = AudioEmotionAnalyzer(api_key="dummy", openai_api_key="dummy")
 
     # Test the dummy mode directly
-    result = analyzer.analyze(str(audio_file))
+    result = await analyzer.analyze(str(audio_file))
 
     # Assertions
     assert isinstance(result, dict)
@@ -21,7 +37,8 @@ def test_analyze_returns_scores_for_dummy_audio(tmp_path):
     assert "joy" in result
     assert "sadness" in result
 
-def test_transcribe_audio_with_openai(tmp_path):
+@pytest.mark.anyio
+async def test_transcribe_audio_with_openai(tmp_path):
     # Create dummy WAV file
     audio_file = tmp_path / "test_audio.wav"
     audio_file.write_bytes(b"RIFF....WAVEfmt ")
@@ -34,21 +51,22 @@ def test_transcribe_audio_with_openai(tmp_path):
     mock_transcript.text = "This is a test transcript with positive emotions."
 
     # Mock the client.audio.transcriptions.create method
-    mock_transcription = MagicMock(return_value=mock_transcript)
+    mock_transcription = AsyncMock(return_value=mock_transcript)
     analyzer.client = MagicMock()
     analyzer.client.audio = MagicMock()
     analyzer.client.audio.transcriptions = MagicMock()
     analyzer.client.audio.transcriptions.create = mock_transcription
 
     # Call the transcribe method
-    result = analyzer._transcribe_audio(str(audio_file))
+    result = await analyzer._transcribe_audio(str(audio_file))
 
     # Assertions
     assert isinstance(result, str)
     assert "test transcript" in result
     assert mock_transcription.called
 
-def test_analyze_with_mocked_api(tmp_path):
+@pytest.mark.anyio
+async def test_analyze_with_mocked_api(tmp_path, openai_response):
     # Create dummy WAV file
     audio_file = tmp_path / "test_audio.wav"
     audio_file.write_bytes(b"RIFF....WAVEfmt ")
@@ -59,23 +77,10 @@ def test_analyze_with_mocked_api(tmp_path):
     # Mock transcribe_audio to return a fixed transcript
     with patch.object(analyzer, '_transcribe_audio', return_value="I'm feeling excited!"):
         # Create mock chat completion response
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message = MagicMock()
-        mock_response.choices[0].message.content = """
-        {
-            "joy": 0.7,
-            "sadness": 0.05,
-            "anger": 0.0,
-            "fear": 0.0,
-            "surprise": 0.15,
-            "disgust": 0.0,
-            "neutral": 0.1
-        }
-        """
+        mock_response = openai_response(_MOCK_EMOTIONS_JSON)
 
         # Mock the chat completions create method
-        mock_completions = MagicMock(return_value=mock_response)
+        mock_completions = AsyncMock(return_value=mock_response)
         mock_chat = MagicMock()
         mock_chat.completions = MagicMock()
         mock_chat.completions.create = mock_completions
@@ -83,7 +88,7 @@ def test_analyze_with_mocked_api(tmp_path):
         analyzer.client.chat = mock_chat
 
         # Call the analyze method
-        result = analyzer.analyze(str(audio_file))
+        result = await analyzer.analyze(str(audio_file))
 
         # Assertions
         assert isinstance(result, dict)
@@ -93,8 +98,90 @@ def test_analyze_with_mocked_api(tmp_path):
         assert mock_completions.called
 
         # Check the expected emotions are present
-        assert "joy" in result
-        assert "sadness" in result
-        assert "anger" in result
-        assert "fear" in result
-        assert "surprise" in result
+        assert result == _MOCK_EMOTIONS
+
+@pytest.mark.anyio
+async def test_analyze_caches_repeated_transcripts(tmp_path, openai_response):
+    audio_file = tmp_path / "test_audio.wav"
+    audio_file.write_bytes(b"RIFF....WAVEfmt ")
+
+    analyzer = AudioEmotionAnalyzer(api_key="test_key", openai_api_key="test_key")
+
+    with patch.object(analyzer, '_transcribe_audio', return_value="Same transcript"):
+        mock_response = openai_response('{"joy": 0.9, "neutral": 0.1}')
+
+        mock_completions = AsyncMock(return_value=mock_response)
+        analyzer.client = MagicMock()
+        analyzer.client.chat.completions.create = mock_completions
+
+        first = await analyzer.analyze(str(audio_file))
+        second = await analyzer.analyze(str(audio_file))
+
+        assert first == second == {"joy": 0.9, "neutral": 0.1}
+        assert mock_completions.call_count == 1
+
+@pytest.mark.anyio
+async def test_transcribe_audio_with_local_whisper(tmp_path, monkeypatch):
+    audio_file = tmp_path / "test_audio.wav"
+    audio_file.write_bytes(b"RIFF....WAVEfmt ")
+
+    # Stub faster-whisper model returning two segments
+    mock_model = MagicMock()
+    mock_model.transcribe.return_value = (
+        [MagicMock(text=" Hello there."), MagicMock(text=" Local transcript.")],
+        None
+    )
+    mock_model_cls = MagicMock(return_value=mock_model)
+    monkeypatch.setitem(sys.modules, "faster_whisper", SimpleNamespace(WhisperModel=mock_model_cls))
+
+    analyzer = AudioEmotionAnalyzer(api_key="local", openai_api_key="dummy", whisper_num_workers=2)
+    result = await analyzer.transcribe_batch([str(audio_file), str(audio_file)])
+
+    assert result == ["Hello there. Local transcript."] * 2
+    assert mock_model_cls.call_args.kwargs["compute_type"] == "int8"
+    assert mock_model_cls.call_args.kwargs["num_workers"] == 2
+    mock_model.transcribe.assert_called_with(str(audio_file), beam_size=1, vad_filter=True)
+
+def test_local_whisper_requires_faster_whisper(monkeypatch):
+    # A None entry makes the import raise ImportError, as if the package were missing
+    monkeypatch.setitem(sys.modules, "faster_whisper", None)
+
+    with pytest.raises(ImportError):
+        AudioEmotionAnalyzer(api_key="local", openai_api_key="dummy")
+
+@pytest.mark.anyio
+async def test_analyze_many_uses_single_batched_call(openai_response):
+    analyzer = AudioEmotionAnalyzer(api_key="test_key", openai_api_key="test_key")
+
+    mock_response = openai_response("""
+    {"results": [{"joy": 0.9, "neutral": 0.1}, {"sadness": 0.8, "neutral": 0.2}]}
+    """)
+    mock_completions = AsyncMock(return_value=mock_response)
+    analyzer.client = MagicMock()
+    analyzer.client.chat.completions.create = mock_completions
+
+    result = await analyzer.analyze_many(["Happy transcript", "Sad transcript", ""])
+
+    assert result == [
+        {"joy": 0.9, "neutral": 0.1},
+        {"sadness": 0.8, "neutral": 0.2},
+        {"neutral": 1.0, "joy": 0.0, "sadness": 0.0, "anger": 0.0,
+         "fear": 0.0, "surprise": 0.0, "disgust": 0.0},
+    ]
+    assert mock_completions.call_count == 1
+
+@pytest.mark.anyio
+async def test_analyze_many_falls_back_on_length_mismatch(openai_response):
+    analyzer = AudioEmotionAnalyzer(api_key="test_key", openai_api_key="test_key")
+
+    batch_response = openai_response('{"results": [{"joy": 1.0}]}')
+    single_response = openai_response('{"surprise": 1.0}')
+
+    mock_completions = AsyncMock(side_effect=[batch_response, single_response, single_response])
+    analyzer.client = MagicMock()
+    analyzer.client.chat.completions.create = mock_completions
+
+    result = await analyzer.analyze_many(["First transcript", "Second transcript"])
+
+    assert result == [{"surprise": 1.0}, {"surprise": 1.0}]
+    assert mock_completions.call_count == 3
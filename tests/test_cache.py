@@ -0,0 +1,45 @@
+from src.cache import LRUCache, content_hash
+
+def test_content_hash_is_stable_and_order_independent():
+    """Test that dict key order does not change the hash."""
+    assert content_hash({"a": 1, "b": 2}) == content_hash({"b": 2, "a": 1})
+    assert content_hash("text", 2) != content_hash("text", 3)
+
+def test_lru_cache_get_and_set():
+    """Test basic cache hits and misses."""
+    cache = LRUCache(maxsize=2)
+
+    assert cache.get("missing") is None
+    assert cache.get("missing", "default") == "default"
+
+    cache.set("a", 1)
+    assert "a" in cache
+    assert cache.get("a") == 1
+
+def test_lru_cache_evicts_least_recently_used():
+    """Test that the oldest untouched entry is evicted when full."""
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    # Touch "a" so "b" becomes the least recently used entry
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert len(cache) == 2
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+
+def test_lru_cache_expires_entries_after_ttl():
+    """Test that entries older than the TTL are treated as misses."""
+    now = [1000.0]
+    cache = LRUCache(maxsize=2, ttl=10, clock=lambda: now[0])
+    cache.set("a", 1)
+
+    now[0] += 5
+    assert cache.get("a") == 1
+
+    now[0] += 10
+    assert "a" not in cache
+    assert cache.get("a") is None
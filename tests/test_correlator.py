@@ -1,6 +1,7 @@
 import pytest
 from src.correlator import Correlator
-from src.scraper import VideoData
+import numpy as np
+from src.scraper import METADATA_FIELDS, VideoData, metadata_matrix
 
 def test_correlator_init():
     """Test that Correlator initializes correctly."""
@@ -8,23 +9,10 @@ def test_correlator_init():
     assert hasattr(corr, "emotions")
     assert hasattr(corr, "metadata_fields")
 
-def test_compute_returns_expected_keys():
+def test_compute_returns_expected_keys(correlator_video_data):
     """Test that compute returns a dictionary with expected keys."""
     corr = Correlator()
-
-    # Create dummy VideoData
-    video_data = [
-        VideoData(
-            url="https://example.com/video1",
-            comments=["Great video!", "Love it!"],
-            metadata={"likes": 100, "comments": 2, "shares": 50, "views": 1000}
-        ),
-        VideoData(
-            url="https://example.com/video2",
-            comments=["Nice content", "Could be better"],
-            metadata={"likes": 80, "comments": 2, "shares": 30, "views": 800}
-        )
-    ]
+    video_data = correlator_video_data
 
     # Create dummy emotion scores
     text_scores = {
@@ -101,3 +89,66 @@ def test_compute_handles_missing_metadata():
     # Fields with zero values should result in zero correlation
     assert "joy_vs_comments" in result
     assert result["joy_vs_comments"] == 0.0
+
+def test_compute_ratio_values():
+    """Test the emotion/metadata ratios against hand-computed values."""
+    corr = Correlator()
+
+    video_data = [
+        VideoData(
+            url="https://example.com/video1",
+            comments=["One", "Two"],
+            metadata={"likes": 100, "comments": 2, "shares": 0, "views": 1000}
+        ),
+        VideoData(
+            url="https://example.com/video2",
+            comments=["Three", "Four"],
+            metadata={"likes": 300, "comments": 2, "shares": 0, "views": 3000}
+        )
+    ]
+
+    result = corr.compute(video_data, {"joy": 0.6}, {"joy": 0.2})
+
+    # Combined joy = 0.4; average likes = 200, views = 2000, comments = 2
+    assert result["joy_vs_likes"] == 0.2
+    assert result["joy_vs_views"] == 0.02
+    assert result["joy_vs_comments"] == 20.0
+    assert result["joy_vs_shares"] == 0.0
+    assert result["sadness_vs_likes"] == 0.0
+    # 4 comments in total
+    assert result["joy_comment_ratio"] == 10.0
+
+def test_metadata_matrix_keeps_large_counts_exact():
+    """Test that view counts beyond float32 precision survive the matrix unchanged."""
+    views = 2**24 + 1
+    video = VideoData(url="https://example.com/video1", comments=[], metadata={"views": views})
+
+    matrix = metadata_matrix([video])
+
+    assert matrix[0, METADATA_FIELDS.index("views")] == views
+
+def test_compute_with_precomputed_metadata_matrix():
+    """Test that a scraper-built metadata matrix gives the same result as dict lookups."""
+    corr = Correlator()
+
+    video_data = [
+        VideoData(
+            url="https://example.com/video1",
+            comments=["One", "Two"],
+            metadata={"likes": 100, "comments": 2, "shares": 10, "views": 1000}
+        ),
+        VideoData(
+            url="https://example.com/video2",
+            comments=["Three"],
+            metadata={"likes": 300, "views": 3000}
+        )
+    ]
+    text_scores = {"joy": 0.6, "fear": 0.2}
+    audio_scores = {"joy": 0.2, "surprise": 0.4}
+
+    matrix = metadata_matrix(video_data)
+
+    assert matrix.dtype == np.float64
+    assert matrix.shape == (2, len(corr.metadata_fields))
+    assert corr.compute(video_data, text_scores, audio_scores, metadata_matrix=matrix) == \
+        corr.compute(video_data, text_scores, audio_scores)
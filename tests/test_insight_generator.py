@@ -1,6 +1,33 @@
+import functools
+import json
 import pytest
-from unittest.mock import patch, MagicMock
-from src.insight_generator import InsightGenerator
+import sys
+import threading
+import numpy as np
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock, AsyncMock
+from src.insight_generator import InsightGenerator, TONE_GUIDELINE_QUERY, _INSIGHTS_SYSTEM_PROMPT
+
+# Payloads returned by the mocked chat completions
+_MOCK_INSIGHTS = ["Mocked insight 1", "Mocked insight 2"]
+_MOCK_INSIGHTS_JSON = json.dumps({"insights": _MOCK_INSIGHTS})
+_MOCK_HOOKS = ["Mocked PR hook 1", "Mocked PR hook 2"]
+_MOCK_HOOKS_JSON = json.dumps({"hooks": _MOCK_HOOKS})
+
+@functools.lru_cache(maxsize=None)
+def _cached_generator(guidelines):
+    return InsightGenerator(brand_guidelines=guidelines, pinecone_api_key="dummy", openai_api_key="dummy")
+
+@pytest.fixture
+def make_generator():
+    """Return a factory handing out the generator built once per guideline text, reset for this test."""
+    def make(guidelines):
+        ig = _cached_generator(guidelines)
+        ig.client = None
+        for cache in (ig._query_embedding_cache, ig._insight_cache, ig._hook_cache):
+            cache.clear()
+        return ig
+    return make
 
 @pytest.fixture
 def dummy_guidelines():
@@ -23,6 +50,16 @@ def dummy_guidelines():
     Avoid stock photos that feel staged or inauthentic.
     """
 
+@pytest.fixture(scope="module")
+def ig_dummy():
+    """Dummy-mode generator shared by tests that do not change its state."""
+    return InsightGenerator(
+        brand_guidelines="Test guidelines",
+        pinecone_api_key="dummy",
+        openai_api_key="dummy",
+        vector_search=False
+    )
+
 @pytest.fixture
 def dummy_correlations():
     """Fixture for dummy correlation data."""
@@ -58,7 +95,7 @@ def test_init_with_custom_environment():
 
     assert ig.pinecone_environment == "custom-env"
 
-def test_parse_guidelines():
+def test_parse_guidelines(make_generator):
     """Test that guidelines are parsed correctly."""
     guidelines = """
     Paragraph 1
@@ -68,146 +105,402 @@ def test_parse_guidelines():
     Paragraph 3
     """
 
-    ig = InsightGenerator(
-        brand_guidelines=guidelines,
-        pinecone_api_key="dummy",
-        openai_api_key="dummy"
-    )
+    ig = make_generator(guidelines)
 
     assert len(ig._guideline_chunks) == 3
     assert "Paragraph 1" in ig._guideline_chunks[0]
     assert "Paragraph 2" in ig._guideline_chunks[1]
     assert "Paragraph 3" in ig._guideline_chunks[2]
 
-def test_generate_insights_dummy_mode(dummy_correlations):
-    """Test that generate returns dummy insights in dummy mode."""
-    ig = InsightGenerator(
-        brand_guidelines="Test guidelines",
-        pinecone_api_key="dummy",
-        openai_api_key="dummy"
-    )
+def test_parse_guidelines_whitespace_only_separator(make_generator):
+    """Test that blank lines containing only spaces still separate paragraphs."""
+    ig = make_generator("Paragraph 1\n   \nParagraph 2\n\n\n")
 
-    insights = ig.generate(dummy_correlations, n_insights=2)
+    assert ig._guideline_chunks == ["Paragraph 1", "Paragraph 2"]
+
+@pytest.mark.anyio
+async def test_generate_insights_dummy_mode(ig_dummy, dummy_correlations):
+    """Test that generate returns dummy insights in dummy mode."""
+    insights = await ig_dummy.generate(dummy_correlations, n_insights=2)
 
     assert len(insights) == 2
     assert isinstance(insights[0], str)
     assert isinstance(insights[1], str)
 
-def test_generate_insights_none_key(dummy_correlations):
+@pytest.mark.anyio
+async def test_generate_insights_none_key(dummy_correlations):
     """Test that generate handles None API key."""
+    # Guidelines are searched locally even without a Pinecone key, so skip loading the model
     ig = InsightGenerator(
         brand_guidelines="Test guidelines",
         pinecone_api_key=None,
-        openai_api_key=None
+        openai_api_key=None,
+        vector_search=False
     )
 
-    insights = ig.generate(dummy_correlations, n_insights=2)
+    insights = await ig.generate(dummy_correlations, n_insights=2)
 
     assert len(insights) == 2
     assert isinstance(insights[0], str)
     assert isinstance(insights[1], str)
 
-def test_suggest_pr_hooks_dummy_mode():
+@pytest.mark.anyio
+async def test_suggest_pr_hooks_dummy_mode(ig_dummy):
     """Test that suggest_pr_hooks returns dummy hooks in dummy mode."""
-    ig = InsightGenerator(
-        brand_guidelines="Test guidelines",
-        pinecone_api_key="dummy",
-        openai_api_key="dummy"
-    )
-
     insights = ["Insight 1", "Insight 2"]
-    hooks = ig.suggest_pr_hooks(insights, n_hooks=2)
+    hooks = await ig_dummy.suggest_pr_hooks(insights, n_hooks=2)
 
     assert len(hooks) == 2
     assert isinstance(hooks[0], str)
     assert isinstance(hooks[1], str)
 
-@pytest.mark.parametrize("n_insights", [1, 2, 3])
-def test_generate_respects_n_insights(dummy_correlations, n_insights):
+@pytest.mark.anyio
+async def test_generate_respects_n_insights(ig_dummy, dummy_correlations):
     """Test that generate returns the requested number of insights."""
-    ig = InsightGenerator(
-        brand_guidelines="Test guidelines",
-        pinecone_api_key="dummy",
-        openai_api_key="dummy"
-    )
-
-    insights = ig.generate(dummy_correlations, n_insights=n_insights)
-    assert len(insights) == n_insights
+    for n_insights in (1, 2, 3):
+        insights = await ig_dummy.generate(dummy_correlations, n_insights=n_insights)
+        assert len(insights) == n_insights, f"n_insights={n_insights}"
 
-@pytest.mark.parametrize("mock_client_return", [
-    '{"insights": ["Mocked insight 1", "Mocked insight 2"]}'
-])
-def test_generate_with_openai(dummy_guidelines, dummy_correlations, mock_client_return):
+@pytest.mark.anyio
+async def test_generate_with_openai(dummy_guidelines, dummy_correlations, openai_response, make_generator):
     """Test generate with direct OpenAI mock."""
     # Create mock OpenAI client
     mock_client = MagicMock()
 
     # Setup completion response
-    mock_message = MagicMock()
-    mock_message.content = mock_client_return
-
-    mock_choice = MagicMock()
-    mock_choice.message = mock_message
-
-    mock_response = MagicMock()
-    mock_response.choices = [mock_choice]
+    mock_response = openai_response(_MOCK_INSIGHTS_JSON)
 
-    mock_client.chat.completions.create.return_value = mock_response
+    mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
 
     # Create instance
-    ig = InsightGenerator(
-        brand_guidelines=dummy_guidelines,
-        pinecone_api_key="dummy",
-        openai_api_key="fake_key"
-    )
+    ig = make_generator(dummy_guidelines)
 
     # Set our mock client
     ig.client = mock_client
 
     # Test generate
-    insights = ig.generate(dummy_correlations, n_insights=2)
+    insights = await ig.generate(dummy_correlations, n_insights=2)
 
     # Verify results
-    assert len(insights) == 2
-    assert insights[0] == "Mocked insight 1"
-    assert insights[1] == "Mocked insight 2"
+    assert insights == _MOCK_INSIGHTS
     assert mock_client.chat.completions.create.called
 
-@pytest.mark.parametrize("mock_client_return", [
-    '{"hooks": ["Mocked PR hook 1", "Mocked PR hook 2"]}'
-])
-def test_suggest_pr_hooks_with_openai(dummy_guidelines, mock_client_return):
+    # The static system prompt is sent first with a stable prompt cache key
+    call_kwargs = mock_client.chat.completions.create.call_args.kwargs
+    assert call_kwargs["messages"][0]["content"] == _INSIGHTS_SYSTEM_PROMPT
+    assert call_kwargs["extra_body"] == {"prompt_cache_key": "cooper-insights"}
+
+@pytest.mark.anyio
+async def test_suggest_pr_hooks_with_openai(dummy_guidelines, openai_response, make_generator):
     """Test suggest_pr_hooks with direct OpenAI mock."""
     # Create mock OpenAI client
     mock_client = MagicMock()
 
     # Setup completion response
-    mock_message = MagicMock()
-    mock_message.content = mock_client_return
+    mock_response = openai_response(_MOCK_HOOKS_JSON)
+
+    mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
+
+    # Create instance
+    ig = make_generator(dummy_guidelines)
 
-    mock_choice = MagicMock()
-    mock_choice.message = mock_message
+    # Set our mock client
+    ig.client = mock_client
 
-    mock_response = MagicMock()
-    mock_response.choices = [mock_choice]
+    # Test suggest_pr_hooks
+    hooks = await ig.suggest_pr_hooks(["Test insight 1", "Test insight 2"], n_hooks=2)
 
-    mock_client.chat.completions.create.return_value = mock_response
+    # Verify results
+    assert hooks == _MOCK_HOOKS
+    assert mock_client.chat.completions.create.called
+
+@pytest.mark.anyio
+async def test_generate_caches_identical_correlations(dummy_correlations, openai_response, make_generator):
+    """Test that repeated correlations are served without a second API call."""
+    mock_client = MagicMock()
+    mock_response = openai_response('{"insights": ["Cached insight"]}')
+    mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
+
+    ig = make_generator("Test guidelines")
+    ig.client = mock_client
+
+    first = await ig.generate(dummy_correlations, n_insights=1)
+    second = await ig.generate(dict(reversed(list(dummy_correlations.items()))), n_insights=1)
+
+    assert first == second == ["Cached insight"]
+    assert mock_client.chat.completions.create.call_count == 1
+
+def test_build_guideline_index_encodes_in_one_batch(dummy_guidelines, monkeypatch):
+    """Test that all guideline chunks are embedded with a single encode call."""
+    # Force the Pinecone path regardless of guideline size
+    monkeypatch.setattr("src.insight_generator.LOCAL_SEARCH_MAX_CHUNKS", 0)
+    mock_index = MagicMock()
+    monkeypatch.setattr("src.insight_generator._get_pinecone_index", lambda *args: mock_index)
 
-    # Create instance
     ig = InsightGenerator(
         brand_guidelines=dummy_guidelines,
         pinecone_api_key="dummy",
-        openai_api_key="fake_key"
+        openai_api_key="dummy"
     )
+    n_chunks = len(ig._guideline_chunks)
 
-    # Set our mock client
+    embedder = MagicMock()
+    embedder.encode.return_value = np.ones((n_chunks, 4), dtype=np.float32)
+
+    assert ig._build_guideline_index(embedder) == (None, mock_index)
+
+    embedder.encode.assert_called_once()
+    assert embedder.encode.call_args.args[0] == ig._guideline_chunks
+    vectors = mock_index.upsert.call_args.kwargs["vectors"]
+    assert [v["id"] for v in vectors] == [f"guideline-{i}" for i in range(n_chunks)]
+    assert vectors[0]["values"] == [1.0, 1.0, 1.0, 1.0]
+
+def test_build_guideline_index_upserts_in_batches(monkeypatch):
+    """Test that large guideline sets are upserted in UPSERT_BATCH_SIZE chunks."""
+    monkeypatch.setattr("src.insight_generator.LOCAL_SEARCH_MAX_CHUNKS", 0)
+    monkeypatch.setattr("src.insight_generator.UPSERT_BATCH_SIZE", 2)
+    mock_index = MagicMock()
+    monkeypatch.setattr("src.insight_generator._get_pinecone_index", lambda *args: mock_index)
+
+    ig = InsightGenerator(
+        brand_guidelines="One\n\nTwo\n\nThree\n\nFour\n\nFive",
+        pinecone_api_key="dummy",
+        openai_api_key="dummy"
+    )
+    embedder = MagicMock()
+    embedder.encode.return_value = np.zeros((5, 4), dtype=np.float32)
+
+    ig._build_guideline_index(embedder)
+
+    batches = [call.kwargs["vectors"] for call in mock_index.upsert.call_args_list]
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert batches[-1][0]["metadata"]["text"] == "Five"
+
+def test_search_relevant_guidelines_uses_local_matrix(monkeypatch):
+    """Test that small guideline sets are ranked in memory without Pinecone credentials."""
+    chunk_vectors = np.array([[1.0, 0.0, 0.0], [0.0, 2.0, 0.0], [0.0, 0.0, 3.0]], dtype=np.float32)
+    mock_embedder = MagicMock()
+    mock_embedder.encode.side_effect = lambda texts, **kwargs: (
+        chunk_vectors if isinstance(texts, list) else np.array([0.1, 0.9, 0.5], dtype=np.float32)
+    )
+    mock_get_index = MagicMock()
+    monkeypatch.setattr("src.insight_generator.SENTENCE_TRANSFORMERS_AVAILABLE", True)
+    monkeypatch.setattr("src.insight_generator.PINECONE_AVAILABLE", False)
+    monkeypatch.setattr("src.insight_generator._get_embedder", lambda name: mock_embedder)
+    monkeypatch.setattr("src.insight_generator._get_pinecone_index", mock_get_index)
+    monkeypatch.delenv("PINECONE_API_KEY", raising=False)
+
+    ig = InsightGenerator(
+        brand_guidelines="Tone chunk\n\nVisual chunk\n\nLegal chunk",
+        openai_api_key="dummy"
+    )
+
+    assert ig._search_relevant_guidelines("visual identity", top_k=2) == ["Visual chunk", "Legal chunk"]
+    assert ig._guideline_mat.dtype == np.float32
+    assert np.allclose(np.linalg.norm(ig._guideline_mat, axis=1), 1.0)
+    assert ig._index is None
+    mock_get_index.assert_not_called()
+    assert ig._query_embedding_cache.get("visual identity").dtype == np.float32
+
+def test_search_falls_back_while_index_is_building(monkeypatch):
+    """Test that a search timing out on the index build uses the first chunks, not a partial index."""
+    release = threading.Event()
+    mock_embedder = MagicMock()
+    mock_embedder.encode.side_effect = lambda texts, **kwargs: release.wait(5) and np.eye(2, dtype=np.float32)
+    monkeypatch.setattr("src.insight_generator.SENTENCE_TRANSFORMERS_AVAILABLE", True)
+    monkeypatch.setattr("src.insight_generator._get_embedder", lambda name: mock_embedder)
+    monkeypatch.setattr(InsightGenerator, "INDEX_READY_TIMEOUT_SEC", 0.01)
+
+    ig = InsightGenerator(
+        brand_guidelines="Tone chunk\n\nVisual chunk",
+        pinecone_api_key=None,
+        openai_api_key="dummy"
+    )
+
+    try:
+        assert ig._search_relevant_guidelines("visual identity", top_k=1) == ["Tone chunk"]
+        # Nothing is published before the build completes
+        assert ig._embedder is None
+    finally:
+        release.set()
+    assert ig._index_ready.wait(5)
+    assert ig._embedder is mock_embedder
+
+def test_get_embedder_loads_model_once(monkeypatch):
+    """Test that sentence transformer weights are loaded once per model name."""
+    from src.insight_generator import _get_embedder
+
+    mock_model_cls = MagicMock()
+    monkeypatch.setitem(sys.modules, "sentence_transformers", SimpleNamespace(SentenceTransformer=mock_model_cls))
+    _get_embedder.cache_clear()
+
+    try:
+        assert _get_embedder("test-model") is _get_embedder("test-model")
+        mock_model_cls.assert_called_once_with("test-model")
+    finally:
+        _get_embedder.cache_clear()
+
+def test_get_embedder_quantizes_when_enabled(monkeypatch):
+    """Test that USE_INT8_EMBEDDER swaps in the int8-quantized model."""
+    from src.insight_generator import _get_embedder
+
+    quantized = MagicMock()
+    mock_quantize = MagicMock(return_value=quantized)
+    monkeypatch.setitem(sys.modules, "sentence_transformers", SimpleNamespace(SentenceTransformer=MagicMock()))
+    monkeypatch.setattr("src.insight_generator.USE_INT8_EMBEDDER", True)
+    monkeypatch.setattr("src.insight_generator._quantize_int8", mock_quantize)
+    _get_embedder.cache_clear()
+
+    try:
+        assert _get_embedder("test-model") is quantized
+        mock_quantize.assert_called_once()
+    finally:
+        _get_embedder.cache_clear()
+
+@pytest.mark.anyio
+async def test_suggest_pr_hooks_caches_identical_insights(openai_response, make_generator):
+    """Test that repeated insight lists are served without a second API call."""
+    mock_client = MagicMock()
+    mock_response = openai_response('{"hooks": ["Cached hook"]}')
+    mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
+
+    ig = make_generator("Test guidelines")
     ig.client = mock_client
 
-    # Test suggest_pr_hooks
-    hooks = ig.suggest_pr_hooks(["Test insight 1", "Test insight 2"], n_hooks=2)
+    first = await ig.suggest_pr_hooks(["Insight 1"], n_hooks=1)
+    second = await ig.suggest_pr_hooks(["Insight 1"], n_hooks=1)
 
-    # Verify results
-    assert len(hooks) == 2
-    assert hooks[0] == "Mocked PR hook 1"
-    assert hooks[1] == "Mocked PR hook 2"
-    assert mock_client.chat.completions.create.called
+    assert first == second == ["Cached hook"]
+    assert mock_client.chat.completions.create.call_count == 1
+
+
+@pytest.mark.anyio
+async def test_generate_with_hooks_batches_guideline_searches(openai_response, make_generator):
+    """Test that correlation and tone guidelines come from one batched search."""
+    insights_response = openai_response('{"insights": ["Insight 1"]}')
+    hooks_response = openai_response('{"hooks": ["Hook 1"]}')
+    mock_client = MagicMock()
+    mock_client.chat.completions.create = AsyncMock(side_effect=[insights_response, hooks_response])
+
+    ig = make_generator("Tone guideline")
+    ig.client = mock_client
+
+    batch_results = [["Correlation guideline"], ["Tone guideline"]]
+    with patch.object(ig, "_search_relevant_guidelines_batch", AsyncMock(return_value=batch_results)) as mock_batch, \
+            patch.object(ig, "_search_relevant_guidelines") as mock_search:
+        insights, hooks = await ig.generate_with_hooks({"joy_vs_likes": 1.2}, n_insights=1, n_hooks=1)
+
+    assert insights == ["Insight 1"]
+    assert hooks == ["Hook 1"]
+    mock_batch.assert_awaited_once_with(["joy_vs_likes: 1.2", TONE_GUIDELINE_QUERY])
+    mock_search.assert_not_called()
+    insights_prompt, hooks_prompt = (
+        call.kwargs["messages"][1]["content"] for call in mock_client.chat.completions.create.call_args_list
+    )
+    assert "Correlation guideline" in insights_prompt
+    assert "Tone guideline" in hooks_prompt
+
+@pytest.mark.anyio
+async def test_generate_with_hooks_skips_search_for_cached_results(openai_response, make_generator):
+    """Test that a repeated request is served from the result caches without embedding or searching."""
+    mock_client = MagicMock()
+    mock_client.chat.completions.create = AsyncMock(side_effect=[
+        openai_response('{"insights": ["Insight 1"]}'), openai_response('{"hooks": ["Hook 1"]}')
+    ])
+
+    ig = make_generator("Tone guideline")
+    ig.client = mock_client
+
+    batch_results = [["Correlation guideline"], ["Tone guideline"]]
+    with patch.object(ig, "_search_relevant_guidelines_batch", AsyncMock(return_value=batch_results)) as mock_batch, \
+            patch.object(ig, "_search_relevant_guidelines") as mock_search:
+        first = await ig.generate_with_hooks({"joy_vs_likes": 1.2}, n_insights=1, n_hooks=1)
+        second = await ig.generate_with_hooks({"joy_vs_likes": 1.2}, n_insights=1, n_hooks=1)
+
+    assert first == second == (["Insight 1"], ["Hook 1"])
+    mock_batch.assert_awaited_once()
+    mock_search.assert_not_called()
+    assert mock_client.chat.completions.create.call_count == 2
+
+@pytest.mark.anyio
+async def test_search_relevant_guidelines_batch_ranks_all_queries_at_once():
+    """Test that a batch of queries is embedded in one encode call and ranked in memory."""
+    ig = InsightGenerator(
+        brand_guidelines="Tone chunk\n\nVisual chunk",
+        pinecone_api_key="dummy",
+        openai_api_key="dummy"
+    )
+    ig._embedder = MagicMock()
+    ig._embedder.encode.return_value = np.array([[0.0, 1.0], [2.0, 0.0]], dtype=np.float32)
+    ig._guideline_mat = np.eye(2, dtype=np.float32)
+
+    results = await ig._search_relevant_guidelines_batch(["visual identity", "brand tone"], top_k=1)
+
+    assert results == [["Visual chunk"], ["Tone chunk"]]
+    ig._embedder.encode.assert_called_once()
+    assert ig._embedder.encode.call_args.args[0] == ["visual identity", "brand tone"]
+
+@pytest.mark.anyio
+async def test_search_relevant_guidelines_batch_reuses_cached_query_embeddings():
+    """Test that only queries missing from the embedding cache are encoded, and are cached afterwards."""
+    ig = InsightGenerator(
+        brand_guidelines="Tone chunk\n\nVisual chunk",
+        pinecone_api_key="dummy",
+        openai_api_key="dummy"
+    )
+    ig._embedder = MagicMock()
+    ig._embedder.encode.return_value = np.array([[0.0, 1.0]], dtype=np.float32)
+    ig._guideline_mat = np.eye(2, dtype=np.float32)
+    ig._query_embedding_cache.set(TONE_GUIDELINE_QUERY, np.array([2.0, 0.0], dtype=np.float32))
+
+    results = await ig._search_relevant_guidelines_batch(["visual identity", TONE_GUIDELINE_QUERY], top_k=1)
+
+    assert results == [["Visual chunk"], ["Tone chunk"]]
+    assert ig._embedder.encode.call_args.args[0] == ["visual identity"]
+    assert np.array_equal(ig._query_embedding_cache.get("visual identity"), [0.0, 1.0])
+
+    await ig._search_relevant_guidelines_batch(["visual identity", TONE_GUIDELINE_QUERY], top_k=1)
+    ig._embedder.encode.assert_called_once()
+
+def test_init_without_vector_search_starts_no_loader(monkeypatch):
+    """Test that vector_search=False never loads the embedder and searches fall back to the first chunks."""
+    mock_get_embedder = MagicMock()
+    monkeypatch.setattr("src.insight_generator.SENTENCE_TRANSFORMERS_AVAILABLE", True)
+    monkeypatch.setattr("src.insight_generator._get_embedder", mock_get_embedder)
+
+    ig = InsightGenerator(
+        brand_guidelines="Tone chunk\n\nVisual chunk",
+        pinecone_api_key=None,
+        openai_api_key="dummy",
+        vector_search=False
+    )
+
+    assert ig._index_ready.is_set()
+    assert ig._search_relevant_guidelines("visual identity", top_k=1) == ["Tone chunk"]
+    mock_get_embedder.assert_not_called()
+
+def test_init_builds_index_in_background(monkeypatch):
+    """Test that the constructor returns before the guideline index is built."""
+    release = threading.Event()
+    chunk_vectors = np.eye(2, dtype=np.float32)
+    mock_embedder = MagicMock()
+    mock_embedder.encode.side_effect = lambda texts, **kwargs: (
+        release.wait(5) and chunk_vectors if isinstance(texts, list) else np.array([0.0, 1.0], dtype=np.float32)
+    )
+    monkeypatch.setattr("src.insight_generator.SENTENCE_TRANSFORMERS_AVAILABLE", True)
+    monkeypatch.setattr("src.insight_generator.PINECONE_AVAILABLE", True)
+    monkeypatch.setattr("src.insight_generator._get_embedder", lambda name: mock_embedder)
+    monkeypatch.setattr("src.insight_generator._get_pinecone_index", lambda *args: MagicMock())
+
+    ig = InsightGenerator(
+        brand_guidelines="Tone chunk\n\nVisual chunk",
+        pinecone_api_key="real_key",
+        openai_api_key="dummy"
+    )
+
+    # The build is still blocked in encode, so the constructor must already have returned
+    assert not ig._index_ready.is_set()
+
+    release.set()
+    assert ig._search_relevant_guidelines("visual identity", top_k=1) == ["Visual chunk"]
+    assert ig._index_ready.is_set()
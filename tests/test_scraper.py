@@ -1,23 +1,74 @@
 import pytest
-from unittest.mock import patch, Mock, MagicMock
-import time
-from typing import Dict, Any, List
+from unittest.mock import AsyncMock
+import asyncio
+import base64
+import json
+import httpx
+import respx
+from types import SimpleNamespace
 
-from src.scraper import Scraper, ScrapeConfig, VideoData, RequestError, ApifyClientError
+from pydantic import ValidationError
+
+from src.scraper import (
+    APIFY_API_URL, Scraper, ScrapeConfig, VideoData, RequestError, ApifyClientError, RETRY_ATTEMPTS,
+    WEBHOOK_SECRET_HEADER,
+)
 
 
 @pytest.fixture
-def mock_scraper():
-    """Create a Scraper instance with mock configuration."""
-    return Scraper(
+def virtual_clock():
+    """Clock and sleep hooks for a Scraper whose waits advance virtual time instead of real time."""
+    clock = SimpleNamespace(now=0.0)
+
+    async def sleep(seconds):
+        clock.now += seconds
+        await asyncio.sleep(0)  # still yield to other tasks
+
+    clock.monotonic = lambda: clock.now
+    clock.sleep = sleep
+    return clock
+
+
+@pytest.fixture(scope="module")
+def shared_scraper():
+    """Build one Scraper per module; its HTTP/2 client and TLS context are costly to create."""
+    scraper = Scraper(
         apify_token="test_token",
         actor_task_id="test_task_id",
         poll_interval=1,  # Fast polling for tests
         timeout=5,        # Short timeout for tests
     )
+    yield scraper
+    # Tests never open a real connection on this client, so it can be closed on a fresh loop
+    asyncio.run(scraper.aclose())
 
 
 @pytest.fixture
+async def mock_scraper(anyio_backend, shared_scraper, virtual_clock):
+    """
+    The shared Scraper on a virtual clock, reset after each test.
+
+    Attributes a test replaces are restored, callback state starts empty, and
+    an HTTP client installed by the test is closed.
+    """
+    state = dict(vars(shared_scraper))
+    shared_scraper._run_finished = {}
+    shared_scraper._run_payloads = {}
+    shared_scraper._clock = virtual_clock.monotonic
+    shared_scraper._sleep = virtual_clock.sleep
+    yield shared_scraper
+    if shared_scraper._http_client is not state["_http_client"]:
+        await shared_scraper._http_client.aclose()
+    vars(shared_scraper).clear()
+    vars(shared_scraper).update(state)
+
+
+def _install_transport(scraper, handler):
+    """Answer the scraper's Apify and webhook requests with handler; mock_scraper closes the client."""
+    scraper._http_client = httpx.AsyncClient(base_url=APIFY_API_URL, transport=httpx.MockTransport(handler))
+
+
+@pytest.fixture(scope="session")
 def sample_config():
     """Create a sample ScrapeConfig for testing."""
     return ScrapeConfig(
@@ -29,7 +80,13 @@ def sample_config():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def sample_config_json(sample_config):
+    """The JSON request body sample_config is sent as."""
+    return sample_config.model_dump(mode="json", by_alias=True)
+
+
+@pytest.fixture(scope="session")
 def sample_response_data():
     """Sample data that would be returned from the API."""
     return {
@@ -51,176 +108,395 @@ def sample_response_data():
 class TestScraper:
     """Tests for the Scraper class."""
 
-    def test_start_scrape_returns_job_id(self, mock_scraper, sample_config):
-        """Test that start_scrape returns a valid job ID using Apify client."""
-        # Mock the task client and call method
-        mock_task_client = Mock()
-        mock_task_client.call.return_value = {"id": "test_job_id"}
+    def test_http_client_targets_apify_api(self, mock_scraper):
+        """Test that one long-lived client is bound to the Apify API."""
+        assert str(mock_scraper._http_client.base_url).rstrip("/") == "https://api.apify.com"
+        # The token must not leak to webhook hosts through default headers
+        assert "Authorization" not in mock_scraper._http_client.headers
+        assert mock_scraper._apify_headers == {"Authorization": "Bearer test_token"}
 
-        # Mock the client.task() method to return our mock task client
-        mock_scraper._apify_client.task = Mock(return_value=mock_task_client)
+    @pytest.mark.anyio
+    async def test_start_scrape_returns_job_id(self, mock_scraper, sample_config, sample_config_json):
+        """Test that start_scrape starts a task run via the Apify API and returns its ID."""
+        requests = []
 
-        # Call the method to test
-        job_id = mock_scraper.start_scrape(sample_config)
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(201, json={"data": {"id": "test_job_id", "status": "READY"}})
 
-        # Assert job_id is a string and non-empty
-        assert isinstance(job_id, str)
-        assert job_id == "test_job_id"
-
-        # Verify the task client was called with correct parameters
-        mock_scraper._apify_client.task.assert_called_once_with(mock_scraper.actor_task_id)
-        mock_task_client.call.assert_called_once()
+        _install_transport(mock_scraper, handler)
 
-        # Get the arguments passed to call()
-        args, kwargs = mock_task_client.call.call_args
-        assert "run_input" in kwargs
-        assert kwargs["run_input"] == sample_config.model_dump(by_alias=True)
+        job_id = await mock_scraper.start_scrape(sample_config)
 
-    def test_start_scrape_with_webhook(self, mock_scraper, sample_config):
+        assert job_id == "test_job_id"
+        assert len(requests) == 1
+        assert requests[0].method == "POST"
+        assert requests[0].url.path == "/v2/actor-tasks/test_task_id/runs"
+        assert requests[0].headers["Authorization"] == "Bearer test_token"
+        assert requests[0].headers["Content-Type"] == "application/json"
+        assert json.loads(requests[0].content) == sample_config_json
+
+    @pytest.mark.anyio
+    async def test_start_scrape_with_webhook(self, mock_scraper, sample_config, sample_config_json):
         """Test start_scrape with webhook URL."""
         mock_scraper.webhook_url = "https://example.com/webhook"
 
-        mock_response = Mock()
-        mock_response.json.return_value = {"job_id": "webhook_job_id"}
-        mock_response.raise_for_status.return_value = None
-
-        with patch.object(mock_scraper._http_client, 'post', return_value=mock_response):
-            job_id = mock_scraper.start_scrape(sample_config)
+        with respx.mock:
+            route = respx.post("https://example.com/webhook").respond(json={"job_id": "webhook_job_id"})
 
-            assert job_id == "webhook_job_id"
-            mock_scraper._http_client.post.assert_called_once_with(
-                mock_scraper.webhook_url,
-                json=sample_config.model_dump(by_alias=True)
-            )
+            job_id = await mock_scraper.start_scrape(sample_config)
 
-    def test_start_scrape_client_error(self, mock_scraper, sample_config):
-        """Test that start_scrape raises ApifyClientError on client failure."""
-        # Mock the task client to raise an exception
-        mock_task_client = Mock()
-        mock_task_client.call.side_effect = Exception("Client error")
+        assert job_id == "webhook_job_id"
+        assert route.call_count == 1
+        request = route.calls.last.request
+        assert request.headers["Content-Type"] == "application/json"
+        # The Apify token must never reach the webhook host
+        assert "Authorization" not in request.headers
+        assert json.loads(request.content) == sample_config_json
 
-        mock_scraper._apify_client.task = Mock(return_value=mock_task_client)
+    @pytest.mark.anyio
+    async def test_start_scrape_client_error(self, mock_scraper, sample_config):
+        """Test that start_scrape raises ApifyClientError when Apify returns no run."""
+        _install_transport(mock_scraper, lambda request: httpx.Response(201, json={}))
 
-        # Check that ApifyClientError is raised
         with pytest.raises(ApifyClientError):
-            mock_scraper.start_scrape(sample_config)
-
-    def test_get_result_with_apify_client(self, mock_scraper, sample_response_data):
-        """Test that get_result uses Apify client and returns proper data."""
-        # Mock the run client
-        mock_run_client = Mock()
-
-        # Mock the run client's wait_for_finish method
-        mock_run_client.wait_for_finish.return_value = {
-            "id": "test_run_id",
-            "status": "SUCCEEDED",
-            "defaultDatasetId": "test_dataset_id"
-        }
-
-        # Mock the dataset client
-        mock_dataset_client = Mock()
-        mock_dataset_client.list_items.return_value = {
-            "items": sample_response_data["items"]
-        }
-
-        # Set up the mock chain
-        mock_scraper._apify_client.run = Mock(return_value=mock_run_client)
-        mock_scraper._apify_client.dataset = Mock(return_value=mock_dataset_client)
-
-        # Call the method to test
-        results = mock_scraper.get_result("test_job_id")
-
-        # Check the results
-        assert len(results) == 2
+            await mock_scraper.start_scrape(sample_config)
+
+    @pytest.mark.anyio
+    async def test_get_result_with_apify_client(self, mock_scraper, sample_response_data):
+        """Test that get_result waits on the run via the Apify API and returns proper data."""
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"data": {
+                "id": "test_job_id",
+                "status": "SUCCEEDED",
+                "defaultDatasetId": "test_dataset_id"
+            }})
+
+        _install_transport(mock_scraper, handler)
+        mock_scraper._fetch_dataset_items = AsyncMock(return_value=sample_response_data["items"])
+
+        results = await mock_scraper.get_result("test_job_id")
+
         assert all(isinstance(item, VideoData) for item in results)
-        assert results[0].url == "https://example.com/video1"
-        assert results[1].url == "https://example.com/video2"
+        assert tuple(item.url for item in results) == ("https://example.com/video1", "https://example.com/video2")
 
-        # Verify correct methods were called
-        mock_scraper._apify_client.run.assert_called_once_with("test_job_id")
-        mock_run_client.wait_for_finish.assert_called_once_with(wait_secs=mock_scraper._timeout)
-        mock_scraper._apify_client.dataset.assert_called_once_with("test_dataset_id")
-        mock_dataset_client.list_items.assert_called_once()
+        # Apify holds the status request open until the run finishes
+        assert len(requests) == 1
+        assert requests[0].url.path == "/v2/actor-runs/test_job_id"
+        assert requests[0].url.params["waitForFinish"] == str(mock_scraper._timeout)
+        mock_scraper._fetch_dataset_items.assert_called_once_with("test_dataset_id")
 
-    def test_get_result_with_webhook(self, mock_scraper, sample_response_data):
+    @pytest.mark.anyio
+    async def test_get_result_with_webhook(self, mock_scraper, sample_response_data):
         """Test get_result with webhook response."""
         mock_scraper.webhook_url = "https://example.com/webhook"
 
-        # Mock responses for webhook status checks
-        status_responses = [
-            # First call - job is running
-            Mock(
-                json=Mock(return_value={"status": "running"}),
-                raise_for_status=Mock(return_value=None)
-            ),
-            # Second call - job completed
-            Mock(
-                json=Mock(return_value={"status": "completed", "items": sample_response_data["items"]}),
-                raise_for_status=Mock(return_value=None)
+        with respx.mock:
+            route = respx.get("https://example.com/webhook/status/webhook_job_id").mock(side_effect=[
+                httpx.Response(200, json={"status": "running"}),
+                httpx.Response(200, json={"status": "completed", "items": sample_response_data["items"]}),
+            ])
+
+            results = await mock_scraper.get_result("webhook_job_id")
+
+        assert tuple(item.url for item in results) == ("https://example.com/video1", "https://example.com/video2")
+        assert route.call_count == 2
+
+    @pytest.mark.anyio
+    async def test_get_result_timeout_with_webhook(self, mock_scraper, virtual_clock):
+        """Test that webhook polling gives up after the timeout without real waiting."""
+        mock_scraper.webhook_url = "https://example.com/webhook"
+        _install_transport(
+            mock_scraper,
+            lambda request: httpx.Response(200, json={"status": "running"})
+        )
+
+        with pytest.raises(TimeoutError):
+            await mock_scraper.get_result("webhook_job_id")
+        assert virtual_clock.now >= mock_scraper._timeout
+
+    @pytest.mark.anyio
+    async def test_get_result_timeout_with_apify_client(self, mock_scraper):
+        """Test that get_result raises TimeoutError when the run outlives the timeout."""
+        mock_scraper._timeout = 0
+        _install_transport(
+            mock_scraper,
+            lambda request: httpx.Response(200, json={"data": {"id": "test_job_id", "status": "RUNNING"}})
+        )
+
+        with pytest.raises(TimeoutError):
+            await mock_scraper.get_result("test_job_id")
+
+    @pytest.mark.anyio
+    async def test_get_result_failed_run(self, mock_scraper):
+        """Test that get_result raises ApifyClientError when run fails."""
+        _install_transport(
+            mock_scraper,
+            lambda request: httpx.Response(200, json={"data": {"id": "test_run_id", "status": "FAILED"}})
+        )
+
+        with pytest.raises(ApifyClientError):
+            await mock_scraper.get_result("test_job_id")
+
+    @pytest.mark.anyio
+    async def test_get_result_waits_for_callback(self, mock_scraper, sample_config, sample_response_data):
+        """Test that with a callback_url the run comes from the webhook, not from polling."""
+        scraper = mock_scraper
+        scraper.callback_url = "https://cooper.example.com/apify/callback"
+        scraper.webhook_secret = "s3cret"
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(201, json={"data": {"id": "run-123", "status": "READY"}})
+
+        _install_transport(scraper, handler)
+        scraper._fetch_dataset_items = AsyncMock(return_value=sample_response_data["items"])
+
+        job_id = await scraper.start_scrape(sample_config)
+        webhooks = json.loads(base64.b64decode(requests[0].url.params["webhooks"]))
+        assert webhooks[0]["requestUrl"] == "https://cooper.example.com/apify/callback"
+        assert json.loads(webhooks[0]["headersTemplate"]) == {WEBHOOK_SECRET_HEADER: "s3cret"}
+
+        result_task = asyncio.create_task(scraper.get_result(job_id))
+        await asyncio.sleep(0)
+        scraper.notify(job_id, {
+            "resource": {"id": "run-123", "status": "SUCCEEDED", "defaultDatasetId": "dataset-1"}
+        })
+        results = await result_task
+
+        assert tuple(item.url for item in results) == ("https://example.com/video1", "https://example.com/video2")
+        # Only the start request: the finished run came from the callback
+        assert len(requests) == 1
+        scraper._fetch_dataset_items.assert_called_once_with("dataset-1")
+
+    def test_notify_ignores_unknown_runs(self, mock_scraper):
+        """Test that callbacks for runs nobody is waiting on are not stored."""
+        assert mock_scraper.notify("unknown-run", {"resource": {"id": "unknown-run"}}) is False
+        assert mock_scraper._run_payloads == {}
+        assert mock_scraper._run_finished == {}
+
+    def test_callback_url_requires_webhook_secret(self, monkeypatch):
+        """Test that callbacks cannot be enabled without a secret to authenticate them."""
+        monkeypatch.delenv("APIFY_WEBHOOK_SECRET", raising=False)
+        with pytest.raises(ValueError):
+            Scraper(
+                apify_token="test_token",
+                actor_task_id="test_task_id",
+                callback_url="https://cooper.example.com/apify/callback",
+            )
+
+    @pytest.mark.anyio
+    async def test_credentials_from_environment(self, monkeypatch):
+        """Test that the scraper reads its Apify settings from the environment."""
+        monkeypatch.setenv("APIFY_TOKEN", "env_token")
+        monkeypatch.setenv("APIFY_TASK_ID", "user/task")
+        monkeypatch.setenv("APIFY_CALLBACK_URL", "https://cooper.example.com/apify/callback")
+        monkeypatch.setenv("APIFY_WEBHOOK_SECRET", "s3cret")
+
+        scraper = Scraper()
+        await scraper.aclose()
+
+        assert scraper._apify_headers == {"Authorization": "Bearer env_token"}
+        assert scraper.actor_task_id == "user/task"
+        assert scraper.callback_url == "https://cooper.example.com/apify/callback"
+        assert scraper.verify_callback("s3cret")
+        assert not scraper.verify_callback("guess")
+
+    @pytest.mark.anyio
+    async def test_scrape_uses_run_sync_endpoint(self, mock_scraper, sample_config, sample_response_data):
+        """Test that short jobs are scraped in one run-sync request streamed as JSON lines."""
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            lines = "\n".join(json.dumps(item) for item in sample_response_data["items"])
+            return httpx.Response(201, text=lines + "\n")
+
+        _install_transport(mock_scraper, handler)
+
+        results = await mock_scraper.scrape(sample_config)
+
+        assert tuple(item.url for item in results) == ("https://example.com/video1", "https://example.com/video2")
+        assert len(requests) == 1
+        assert requests[0].url.path == "/v2/actor-tasks/test_task_id/run-sync-get-dataset-items"
+        assert requests[0].url.params["format"] == "jsonl"
+        assert requests[0].headers["Authorization"] == "Bearer test_token"
+
+    @pytest.mark.anyio
+    async def test_scrape_run_sync_timeout_falls_back_to_polling(
+        self, mock_scraper, sample_config, sample_response_data
+    ):
+        """Test that a run-sync 408 starts the run normally and polls it to completion."""
+        lines = "".join(json.dumps(item) + "\n" for item in sample_response_data["items"])
+
+        def dataset_page(request: httpx.Request) -> httpx.Response:
+            if request.url.params["limit"] == "0":
+                return httpx.Response(200, json=[], headers={"X-Apify-Pagination-Total": "2"})
+            return httpx.Response(200, text=lines)
+
+        with respx.mock(base_url="https://api.apify.com") as apify:
+            sync_route = apify.post("/v2/actor-tasks/test_task_id/run-sync-get-dataset-items").respond(408)
+            start_route = apify.post("/v2/actor-tasks/test_task_id/runs").respond(
+                201, json={"data": {"id": "run-1", "status": "READY"}}
             )
+            apify.get("/v2/actor-runs/run-1").respond(
+                200, json={"data": {"id": "run-1", "status": "SUCCEEDED", "defaultDatasetId": "dataset-1"}}
+            )
+            apify.get("/v2/datasets/dataset-1/items").mock(side_effect=dataset_page)
+
+            results = await mock_scraper.scrape(sample_config)
+
+        assert tuple(item.url for item in results) == ("https://example.com/video1", "https://example.com/video2")
+        assert sync_route.call_count == 1
+        assert start_route.call_count == 1
+
+    @pytest.mark.anyio
+    async def test_scrape_run_sync_client_timeout(self, mock_scraper, sample_config):
+        """Test that a run-sync request timing out on the client surfaces as TimeoutError."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ReadTimeout("timed out", request=request)
+
+        _install_transport(mock_scraper, handler)
+
+        with pytest.raises(TimeoutError):
+            await mock_scraper.scrape(sample_config)
+
+    @pytest.mark.anyio
+    async def test_fetch_dataset_items_fetches_pages_concurrently(self, mock_scraper):
+        """Test that dataset items are streamed as JSON-lines pages after one count request."""
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            assert request.url.path == "/v2/datasets/dataset-1/items"
+            assert request.headers["Authorization"] == "Bearer test_token"
+            if request.url.params["limit"] == "0":
+                return httpx.Response(200, headers={"X-Apify-Pagination-Total": "2500"}, json=[])
+            assert request.url.params["format"] == "jsonl"
+            offset = int(request.url.params["offset"])
+            return httpx.Response(200, text=f'{{"offset": {offset}}}\n{{"offset": {offset + 1}}}\n')
+
+        _install_transport(mock_scraper, handler)
+
+        items = await mock_scraper._fetch_dataset_items("dataset-1")
+
+        assert items == [
+            {"offset": 0}, {"offset": 1}, {"offset": 1000}, {"offset": 1001}, {"offset": 2000}, {"offset": 2001}
         ]
+        assert len(requests) == 4
 
-        with patch.object(mock_scraper._http_client, 'get') as mock_get:
-            mock_get.side_effect = status_responses
+    @pytest.mark.anyio
+    async def test_fetch_dataset_items_without_total_reads_pages_until_short(self, mock_scraper, monkeypatch):
+        """Test that a missing pagination total falls back to sequential pages instead of returning nothing."""
+        monkeypatch.setattr("src.scraper.DATASET_PAGE_SIZE", 2)
+        offsets = []
 
-            results = mock_scraper.get_result("webhook_job_id")
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.params["limit"] == "0":
+                return httpx.Response(200, json=[])
+            offset = int(request.url.params["offset"])
+            offsets.append(offset)
+            lines = "".join(f'{{"index": {i}}}\n' for i in range(offset, min(offset + 2, 5)))
+            return httpx.Response(200, text=lines)
 
-            assert len(results) == 2
-            assert results[0].url == "https://example.com/video1"
-            assert results[1].url == "https://example.com/video2"
-            assert mock_get.call_count == 2
+        _install_transport(mock_scraper, handler)
 
-            # Check first call was to correct webhook URL
-            args, _ = mock_get.call_args_list[0]
-            assert args[0] == "https://example.com/webhook/status/webhook_job_id"
+        items = await mock_scraper._fetch_dataset_items("dataset-1")
 
-    def test_get_result_timeout_with_apify_client(self, mock_scraper):
-        """Test that get_result raises TimeoutError when client times out."""
-        # Mock the run client
-        mock_run_client = Mock()
+        assert items == [{"index": i} for i in range(5)]
+        assert offsets == [0, 2, 4]
 
-        # Make wait_for_finish raise TimeoutError
-        mock_run_client.wait_for_finish.side_effect = TimeoutError("Timed out")
+    @pytest.mark.anyio
+    async def test_check_status_retries_transient_errors(self, mock_scraper):
+        """Test that 5xx responses are retried, honoring Retry-After."""
+        mock_scraper.webhook_url = "https://example.com/webhook"
+        responses = [
+            httpx.Response(503, headers={"Retry-After": "0"}),
+            httpx.Response(200, json={"status": "running"}),
+        ]
+        _install_transport(mock_scraper, lambda request: responses.pop(0))
 
-        # Set up the mock
-        mock_scraper._apify_client.run = Mock(return_value=mock_run_client)
+        assert await mock_scraper._check_status("job-1") == {"status": "running"}
+        assert responses == []
 
-        # Check that TimeoutError is raised
-        with pytest.raises(TimeoutError):
-            mock_scraper.get_result("test_job_id")
+    @pytest.mark.anyio
+    async def test_check_status_gives_up_after_bounded_retries(self, mock_scraper):
+        """Test that persistent failures raise RequestError after RETRY_ATTEMPTS tries."""
+        mock_scraper.webhook_url = "https://example.com/webhook"
+        calls = []
 
-        # Verify correct methods were called
-        mock_scraper._apify_client.run.assert_called_once_with("test_job_id")
-        mock_run_client.wait_for_finish.assert_called_once_with(wait_secs=mock_scraper._timeout)
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(500, headers={"Retry-After": "0"})
 
-    def test_get_result_failed_run(self, mock_scraper):
-        """Test that get_result raises ApifyClientError when run fails."""
-        # Mock the run client
-        mock_run_client = Mock()
+        _install_transport(mock_scraper, handler)
+
+        with pytest.raises(RequestError):
+            await mock_scraper._check_status("job-1")
+        assert len(calls) == RETRY_ATTEMPTS
 
-        # Mock a failed run
-        mock_run_client.wait_for_finish.return_value = {
-            "id": "test_run_id",
-            "status": "FAILED",
-        }
+    @pytest.mark.anyio
+    async def test_check_status_does_not_retry_client_errors(self, mock_scraper):
+        """Test that non-transient 4xx responses fail immediately."""
+        mock_scraper.webhook_url = "https://example.com/webhook"
+        calls = []
 
-        # Set up the mock
-        mock_scraper._apify_client.run = Mock(return_value=mock_run_client)
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(404)
 
-        # Check that ApifyClientError is raised
-        with pytest.raises(ApifyClientError):
-            mock_scraper.get_result("test_job_id")
-
-    def test_parse_result_validation_error(self, mock_scraper):
-        """Test that _parse_result raises ValidationError on invalid data."""
-        invalid_data = {
-            "items": [
-                {
-                    # Missing required fields
-                    "url": "https://example.com/video1"
-                }
-            ]
-        }
-
-        with pytest.raises(Exception):  # Could be ValidationError or similar
-            mock_scraper._parse_result(invalid_data)
+        _install_transport(mock_scraper, handler)
+
+        with pytest.raises(RequestError):
+            await mock_scraper._check_status("job-1")
+        assert len(calls) == 1
+
+    def test_backoff_delay_grows_and_is_capped(self, mock_scraper):
+        """Test that poll delays double per attempt, stay jittered and respect the cap."""
+        mock_scraper._max_poll_interval = 8
+
+        for attempt, ceiling in enumerate([1, 2, 4, 8, 8, 8]):
+            delay = mock_scraper._backoff_delay(attempt)
+            assert ceiling / 2 <= delay <= ceiling
+
+    @pytest.mark.anyio
+    async def test_scrape_many_runs_jobs_concurrently(self, mock_scraper, sample_config, sample_response_data):
+        """Test that scrape_many starts and awaits all jobs together."""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_get_result(job_id):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return mock_scraper._parse_result(sample_response_data)
+
+        mock_scraper.start_scrape = AsyncMock(side_effect=["job-1", "job-2", "job-3"])
+        mock_scraper.get_result = fake_get_result
+
+        results = await mock_scraper.scrape_many([sample_config] * 3)
+
+        assert len(results) == 3
+        assert all(len(videos) == 2 for videos in results)
+        assert max_in_flight == 3
+
+    def test_parse_result_validates_all_items(self, mock_scraper, sample_response_data):
+        """Test that _parse_result returns VideoData for every item and rejects bad ones."""
+        results = mock_scraper._parse_result(sample_response_data)
+
+        assert tuple(video.url for video in results) == ("https://example.com/video1", "https://example.com/video2")
+        assert all(isinstance(video, VideoData) for video in results)
+
+        with pytest.raises(ValidationError):
+            mock_scraper._parse_result({"items": [{"url": "https://example.com/video1"}]})
+
+    def test_models_are_fully_built_at_import(self):
+        """Test that pydantic finished building the models' validators when they were defined."""
+        assert VideoData.__pydantic_complete__
+        assert ScrapeConfig.__pydantic_complete__
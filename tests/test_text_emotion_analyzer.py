@@ -1,15 +1,38 @@
 import pytest
-from src.text_emotion_analyzer import TextEmotionAnalyzer
-from unittest.mock import patch, MagicMock
+import numpy as np
+from src.text_emotion_analyzer import TextEmotionAnalyzer, EMOTION_LABELS
+from unittest.mock import patch, MagicMock, AsyncMock
+import asyncio
+from collections.abc import Mapping
+from types import SimpleNamespace
 
-def test_analyze_returns_scores_for_sample_texts():
+# Emotion scores returned by the mocked chat completion, shared by every case
+_MOCK_EMOTION_JSON = (
+    '{"joy":0.6,"sadness":0.1,"anger":0.05,"fear":0.05,"surprise":0.1,"disgust":0.0,"neutral":0.1}'
+)
+
+
+class _FakeCompletions:
+    """Plain async stand-in for client.chat.completions that counts create() calls."""
+
+    def __init__(self, response):
+        self.response = response
+        self.calls = 0
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        return self.response
+
+
+@pytest.mark.anyio
+async def test_analyze_returns_scores_for_sample_texts():
     analyzer = TextEmotionAnalyzer(api_key="dummy")
 
     # Test the dummy mode directly
-    result = analyzer.analyze(["I love this!", "This is sad"])
+    result = await analyzer.analyze(["I love this!", "This is sad"])
 
     # Assertions
-    assert isinstance(result, dict)
+    assert isinstance(result, Mapping)
     assert all(isinstance(k, str) for k in result.keys())
     assert all(isinstance(v, float) for v in result.values())
     assert all(0 <= v <= 1 for v in result.values())
@@ -22,45 +45,180 @@ def test_analyze_returns_scores_for_sample_texts():
     ["I'm angry about what happened."],
     ["I'm happy about the news but worried about the implications."],
 ])
-def test_analyze_with_openai_api(texts, monkeypatch):
+@pytest.mark.anyio
+async def test_analyze_with_openai_api(texts, monkeypatch, openai_response):
     # Create an analyzer with mocked OpenAI client
     analyzer = TextEmotionAnalyzer(api_key="test_key")
 
     # Create mock response
-    mock_response = MagicMock()
-    mock_response.choices = [MagicMock()]
-    mock_response.choices[0].message.content = """
-    {
-        "joy": 0.6,
-        "sadness": 0.1,
-        "anger": 0.05,
-        "fear": 0.05,
-        "surprise": 0.1,
-        "disgust": 0.0,
-        "neutral": 0.1
-    }
-    """
-
-    # Mock the client.chat.completions.create method
-    mock_completions = MagicMock(return_value=mock_response)
-    mock_chat = MagicMock()
-    mock_chat.completions.create = mock_completions
-    analyzer.client = MagicMock()
-    analyzer.client.chat = mock_chat
+    mock_response = openai_response(_MOCK_EMOTION_JSON)
+
+    # Stub the client.chat.completions.create method
+    completions = _FakeCompletions(mock_response)
+    analyzer.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
 
     # Call the analyze method
-    result = analyzer.analyze(texts)
+    result = await analyzer.analyze(texts)
 
     # Assertions
     assert isinstance(result, dict)
-    assert all(isinstance(k, str) for k in result.keys())
-    assert all(isinstance(v, float) for v in result.values())
-    assert all(0 <= v <= 1 for v in result.values())
-    assert mock_completions.called
+    values = list(result.values())
+    assert {type(k) for k in result} == {str}
+    assert {type(v) for v in values} == {float}
+    assert 0 <= min(values) and max(values) <= 1
+    assert completions.calls == 1
 
     # Check the expected emotions are present
-    assert "joy" in result
-    assert "sadness" in result
-    assert "anger" in result
-    assert "fear" in result
-    assert "surprise" in result
+    assert {"joy", "sadness", "anger", "fear", "surprise"} <= result.keys()
+
+@pytest.mark.anyio
+async def test_analyze_caches_repeated_texts(openai_response):
+    analyzer = TextEmotionAnalyzer(api_key="test_key")
+
+    mock_response = openai_response('{"joy": 0.9, "neutral": 0.1}')
+    analyzer.client = MagicMock()
+    analyzer.client.chat.completions.create = AsyncMock(return_value=mock_response)
+
+    first = await analyzer.analyze(["Same comment", "Another one"])
+    second = await analyzer.analyze(["Same comment", "Another one"])
+    await analyzer.analyze(["Different comment"])
+
+    assert first == second == {"joy": 0.9, "neutral": 0.1}
+    assert analyzer.client.chat.completions.create.call_count == 2
+
+@pytest.mark.anyio
+async def test_analyze_coalesces_concurrent_identical_calls(openai_response):
+    analyzer = TextEmotionAnalyzer(api_key="test_key")
+    release = asyncio.Event()
+    calls = 0
+
+    async def fake_create(**kwargs):
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return openai_response('{"joy": 0.9, "neutral": 0.1}')
+
+    analyzer.client = MagicMock()
+    analyzer.client.chat.completions.create = fake_create
+
+    tasks = [asyncio.create_task(analyzer.analyze(["Same comment"])) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert calls == 1
+    assert results == [{"joy": 0.9, "neutral": 0.1}] * 5
+    # Every caller gets its own copy of the shared result
+    assert len({id(result) for result in results}) == 5
+    assert analyzer._pending == {}
+
+@pytest.mark.anyio
+async def test_analyze_many_limits_concurrency(openai_response):
+    analyzer = TextEmotionAnalyzer(api_key="test_key")
+    in_flight = 0
+    max_in_flight = 0
+
+    async def fake_create(**kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        response = openai_response('{"joy": 1.0}')
+        return response
+
+    analyzer.client = MagicMock()
+    analyzer.client.chat.completions.create = fake_create
+
+    results = await analyzer.analyze_many([[f"Comment {i}"] for i in range(5)], concurrency=2)
+
+    assert results == [{"joy": 1.0}] * 5
+    assert max_in_flight == 2
+
+@pytest.mark.anyio
+async def test_analyze_many_serves_cache_hits_without_a_slot(openai_response, monkeypatch):
+    analyzer = TextEmotionAnalyzer(api_key="test_key")
+    analyzer.client = MagicMock()
+    analyzer.client.chat.completions.create = AsyncMock(return_value=openai_response('{"joy": 1.0}'))
+    await analyzer.analyze(["Cached comment"])
+
+    release = asyncio.Event()
+
+    async def blocked_create(**kwargs):
+        await release.wait()
+        return openai_response('{"sadness": 1.0}')
+
+    analyzer.client.chat.completions.create = blocked_create
+
+    # Record each group as soon as it is answered
+    answered = []
+    analyze = analyzer._analyze
+
+    async def recording_analyze(texts, limiter):
+        result = await analyze(texts, limiter)
+        answered.append(texts[0])
+        return result
+
+    monkeypatch.setattr(analyzer, "_analyze", recording_analyze)
+    many = asyncio.create_task(analyzer.analyze_many([["New comment"], ["Cached comment"]], concurrency=1))
+    await asyncio.sleep(0.01)
+
+    # The uncached group holds the only slot, yet the cached one is already answered
+    assert answered == ["Cached comment"]
+    release.set()
+    assert await many == [{"sadness": 1.0}, {"joy": 1.0}]
+
+@pytest.mark.anyio
+async def test_analyze_vector_uses_fixed_float32_layout():
+    analyzer = TextEmotionAnalyzer(api_key="dummy")
+
+    vector = await analyzer.analyze_vector(["I love this!"])
+    scores = await analyzer.analyze(["I love this!"])
+
+    assert vector.dtype == np.float32
+    assert vector.shape == (len(EMOTION_LABELS),)
+    assert vector[EMOTION_LABELS.index("joy")] == np.float32(scores["joy"])
+    # The dummy scores have no neutral entry, so its slot is zero-filled
+    assert vector[EMOTION_LABELS.index("neutral")] == 0.0
+
+@pytest.mark.anyio
+async def test_dummy_result_is_shared_and_read_only():
+    analyzer = TextEmotionAnalyzer(api_key="dummy")
+
+    first = await analyzer.analyze(["One"])
+    second = await analyzer.analyze(["Two"])
+
+    # One shared instance, so callers must not be able to change it for each other
+    assert first is second
+    with pytest.raises(TypeError):
+        first["joy"] = 0.0
+    assert second["joy"] == 0.8
+
+@pytest.mark.anyio
+async def test_analyze_requests_strict_json_schema(openai_response):
+    analyzer = TextEmotionAnalyzer(api_key="test_key")
+
+    mock_response = openai_response('{"joy": 1, "sadness": 0, "anger": 0, "fear": 0, "surprise": 0, "disgust": 0, "neutral": 0}')
+    analyzer.client = MagicMock()
+    analyzer.client.chat.completions.create = AsyncMock(return_value=mock_response)
+
+    result = await analyzer.analyze(["Best day ever"])
+
+    response_format = analyzer.client.chat.completions.create.call_args.kwargs["response_format"]
+    assert response_format["type"] == "json_schema"
+    assert response_format["json_schema"]["strict"] is True
+    assert response_format["json_schema"]["schema"]["required"] == list(EMOTION_LABELS)
+    assert result["joy"] == 1.0 and isinstance(result["joy"], float)
+
+@pytest.mark.anyio
+async def test_analyze_refusal_returns_neutral(openai_response):
+    analyzer = TextEmotionAnalyzer(api_key="test_key")
+
+    mock_response = openai_response(None)
+    analyzer.client = MagicMock()
+    analyzer.client.chat.completions.create = AsyncMock(return_value=mock_response)
+
+    result = await analyzer.analyze(["..."])
+
+    assert result["neutral"] == 1.0
+    assert sum(result.values()) == 1.0
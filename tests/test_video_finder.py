@@ -1,10 +1,4 @@
 import pytest
-import sys
-import os
-
-# Add the parent directory to sys.path to allow imports from src
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
 from src.video_finder import VideoFinder
 
 
@@ -14,24 +8,24 @@ def test_known_topic_returns_10_urls():
 
     # Test for the "cooking" topic
     result = finder.get_videos("cooking")
-    assert isinstance(result, list)
+    assert isinstance(result, tuple)
     assert len(result) == 10
     assert all(isinstance(url, str) for url in result)
 
     # Test for the "fitness" topic
     result = finder.get_videos("fitness")
-    assert isinstance(result, list)
+    assert isinstance(result, tuple)
     assert len(result) == 10
     assert all(isinstance(url, str) for url in result)
 
 
 def test_unknown_topic_returns_empty_list():
-    """Test that an unknown topic returns an empty list."""
+    """Test that an unknown topic returns an empty tuple."""
     finder = VideoFinder()
     result = finder.get_videos("no_such_topic")
-    assert isinstance(result, list)
+    assert isinstance(result, tuple)
     assert len(result) == 0
-    assert result == []
+    assert result == ()
 
 
 def test_direct_url_valid_tiktok():
@@ -39,48 +33,73 @@ def test_direct_url_valid_tiktok():
     finder = VideoFinder()
     valid_url = "https://www.tiktok.com/@username/video/1234567890123456789"
     result = finder.get_videos("any_topic", direct_url=valid_url)
-    assert isinstance(result, list)
+    assert isinstance(result, tuple)
     assert len(result) == 1
     assert result[0] == valid_url
 
 
-def test_direct_url_invalid_tiktok():
+INVALID_DIRECT_URLS = [
+    "https://example.com/video/123",
+    "https://facebook.com/watch/123",
+    "not-a-url-at-all",
+    "http://tiktok.fake.com/video/123",
+]
+
+VALID_TIKTOK_URLS = [
+    "https://www.tiktok.com/@username/video/1234567890123456789",
+    "https://vm.tiktok.com/abcDEF123/",
+    "http://www.tiktok.com/@user123_-./video/987654321",
+]
+
+INVALID_TIKTOK_URLS = [
+    "https://example.com/video/123",
+    "https://tiktok.com/video/123",  # Missing www or vm subdomain
+    "ftp://www.tiktok.com/video/123",  # Wrong protocol
+    "https://www.tiktok.com/video/123<script>",  # Invalid characters
+    "https://www.tiktok.com/",  # Missing path
+    pytest.param("https://www.tiktok.com/" + "a" * 2048, id="too-long"),
+]
+
+
+@pytest.fixture(scope="session")
+def finder():
+    """One VideoFinder per worker; it holds no per-call state."""
+    return VideoFinder()
+
+
+@pytest.mark.parametrize("url", INVALID_DIRECT_URLS)
+def test_direct_url_invalid_tiktok(finder, url):
     """Test that an invalid TikTok URL is rejected when provided directly."""
-    finder = VideoFinder()
-    invalid_urls = [
-        "https://example.com/video/123",
-        "https://facebook.com/watch/123",
-        "not-a-url-at-all",
-        "http://tiktok.fake.com/video/123",
-    ]
+    result = finder.get_videos("any_topic", direct_url=url)
+    assert result == ()
+
+
+@pytest.mark.parametrize("url", VALID_TIKTOK_URLS)
+def test_url_validation_accepts(finder, url):
+    """Test the URL validation method directly on valid TikTok URLs."""
+    assert finder.is_valid_tiktok_url(url)
+
 
-    for url in invalid_urls:
-        result = finder.get_videos("any_topic", direct_url=url)
-        assert isinstance(result, list)
-        assert len(result) == 0, f"URL '{url}' should be rejected"
+@pytest.mark.parametrize("url", INVALID_TIKTOK_URLS)
+def test_url_validation_rejects(finder, url):
+    """Test the URL validation method directly on invalid URLs."""
+    assert not finder.is_valid_tiktok_url(url)
 
 
-def test_url_validation():
-    """Test the URL validation method directly."""
+def test_classify_urls_keeps_valid_urls_in_order(finder):
+    """Test that bulk validation drops invalid URLs and preserves order."""
+    invalid = [url for url in INVALID_TIKTOK_URLS if isinstance(url, str)]
+    urls = [url for pair in zip(invalid, VALID_TIKTOK_URLS) for url in pair]
+    assert finder.classify_urls(urls) == tuple(VALID_TIKTOK_URLS)
+    assert finder.classify_urls(iter(invalid)) == ()
+
+
+def test_known_topic_returns_shared_tuple():
+    """Test that repeated lookups return the same immutable tuple without copying."""
     finder = VideoFinder()
+    assert finder.get_videos("cooking") is finder.get_videos("cooking")
+
 
-    # Valid TikTok URLs
-    valid_urls = [
-        "https://www.tiktok.com/@username/video/1234567890123456789",
-        "https://vm.tiktok.com/abcDEF123/",
-        "http://www.tiktok.com/@user123_-./video/987654321",
-    ]
-
-    # Invalid TikTok URLs
-    invalid_urls = [
-        "https://example.com/video/123",
-        "https://tiktok.com/video/123",  # Missing www or vm subdomain
-        "ftp://www.tiktok.com/video/123",  # Wrong protocol
-        "https://www.tiktok.com/video/123<script>",  # Invalid characters
-    ]
-
-    for url in valid_urls:
-        assert finder.is_valid_tiktok_url(url), f"URL '{url}' should be valid"
-
-    for url in invalid_urls:
-        assert not finder.is_valid_tiktok_url(url), f"URL '{url}' should be invalid"
+def test_instances_share_class_level_mapping():
+    """Test that every VideoFinder serves the same class-level URL tuples."""
+    assert VideoFinder().get_videos("fitness") is VideoFinder().get_videos("fitness")